@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 
 from src.analysis.models import ClassifiedNews
 from src.common.ai_gateway import AiClient, AiResponse
@@ -198,6 +199,8 @@ _KEYWORD_HIGH: set[str] = {
     "circuit breaker", "margin call", "급락", "급등", "폭락", "폭등",
     "파산", "긴급", "서킷브레이커", "금리",
 }
+# 고영향 키워드는 존재 여부만 보므로 하나의 대체식으로 컴파일하여 본문을 한 번만 스캔한다
+_KEYWORD_HIGH_RE = re.compile("|".join(map(re.escape, _KEYWORD_HIGH)))
 _KEYWORD_BEARISH: set[str] = {
     "crash", "plunge", "fall", "drop", "decline", "down", "loss", "weak",
     "halt", "halted", "crisis", "bankrupt", "recession", "default",
@@ -227,7 +230,7 @@ def _fallback_keyword(article: VerifiedArticle) -> ClassifiedNews:
     text = f"{article.title} {article.content[:300]}".lower()
 
     # 영향도 판정
-    is_high = any(kw in text for kw in _KEYWORD_HIGH)
+    is_high = _KEYWORD_HIGH_RE.search(text) is not None
     impact = 0.7 if is_high else 0.4
 
     # 방향 판정
@@ -21,6 +21,9 @@ _HAIKU_TRANSLATE_SYSTEM: str = (
     "영어 뉴스 제목을 한국어로 번역하라. 번역만 출력, 설명 없음."
 )
 
+# 한글 음절 탐지 패턴이다 -- 기사마다 호출되므로 모듈 로드 시 한 번만 컴파일한다
+_HANGUL_RE = re.compile(r"[가-힣]")
+
 
 def _is_korean_source(source: str) -> bool:
     """한국어 매체인지 확인한다."""
@@ -30,7 +33,7 @@ def _is_korean_source(source: str) -> bool:
 
 def _has_korean(text: str) -> bool:
     """텍스트에 한글이 포함되어 있는지 확인한다."""
-    return bool(re.search(r"[가-힣]", text))
+    return _HANGUL_RE.search(text) is not None
 
 
 class NewsTranslator:
@@ -303,9 +303,14 @@ async def _check_position_danger(system: InjectedSystem) -> list[AnomalySignal]:
     return signals
 
 
-def _hash_headline(title: str) -> str:
-    """헤드라인 제목의 SHA-256 해시를 반환한다."""
-    return hashlib.sha256(title.encode()).hexdigest()[:16]
+def _hash_headline(title: str) -> int:
+    """헤드라인 제목의 8바이트 BLAKE2b 지문을 정수로 반환한다.
+
+    소문자화 + 공백 정규화 후 해싱하여 대소문자/줄바꿈만 다른 동일 헤드라인을 같은 지문으로 묶는다.
+    """
+    normalized = " ".join(title.lower().split())
+    digest = hashlib.blake2b(normalized.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
 
 
 async def _check_news_headlines(
@@ -339,7 +344,7 @@ async def _check_news_headlines(
     new_headlines: list[str] = []
     for title in headlines:
         h = _hash_headline(title)
-        if h not in state.seen_headline_hashes:
+        if not state.has_seen_hash(h):
             new_headlines.append(title)
             state.add_seen_hash(h)
 
@@ -54,17 +54,24 @@ class SentinelState(BaseModel):
     emergencies_triggered: int = 0
     last_vix: float | None = None  # 이전 VIX 값 (급변 감지용)
     last_prices: dict[str, float] = Field(default_factory=dict)  # 이전 가격 (스캔 간 변동 감지용)
-    seen_headline_hashes: list[str] = Field(default_factory=list)  # 이미 분류한 헤드라인 해시 (FIFO 순서 보존)
+    seen_headline_hashes: list[int] = Field(default_factory=list)  # 이미 분류한 헤드라인 지문 (FIFO 순서 보존)
+    seen_headline_set: set[int] = Field(default_factory=set)  # O(1) 조회용 지문 집합 (리스트와 동기화)
     errors: list[str] = Field(default_factory=list)
 
     model_config = {"arbitrary_types_allowed": True}
 
-    def add_seen_hash(self, h: str) -> None:
-        """헤드라인 해시를 추가한다. 상한 초과 시 가장 오래된 항목부터 제거한다."""
-        if h in self.seen_headline_hashes:
+    def has_seen_hash(self, h: int) -> bool:
+        """이미 분류한 헤드라인 지문인지 집합으로 확인한다."""
+        return h in self.seen_headline_set
+
+    def add_seen_hash(self, h: int) -> None:
+        """헤드라인 지문을 추가한다. 상한 초과 시 가장 오래된 항목부터 제거한다."""
+        if h in self.seen_headline_set:
             return
         self.seen_headline_hashes.append(h)
+        self.seen_headline_set.add(h)
         if len(self.seen_headline_hashes) > _MAX_SEEN_HEADLINES:
             # FIFO: 앞쪽(오래된)을 절반 제거하여 최근 해시를 보존한다
             trim_count = len(self.seen_headline_hashes) - _MAX_SEEN_HEADLINES // 2
+            self.seen_headline_set.difference_update(self.seen_headline_hashes[:trim_count])
             self.seen_headline_hashes = self.seen_headline_hashes[trim_count:]
@@ -81,6 +81,14 @@ class CacheClient:
             elif key in self._expiry:
                 del self._expiry[key]
 
+    async def ttl(self, key: str) -> float | None:
+        """키의 남은 유효 시간(초)을 반환한다. 키가 없거나 만료되었거나 TTL이 없으면 None이다."""
+        exp = self._expiry.get(key)
+        if exp is None or key not in self._store:
+            return None
+        remaining = exp - time.time()
+        return remaining if remaining > 0 else None
+
     async def delete(self, key: str) -> None:
         """키를 삭제한다. 존재하지 않아도 에러를 발생시키지 않는다."""
         async with self._lock:
@@ -29,6 +29,17 @@ logger = get_logger(__name__)
 # -- 싱글톤 인스턴스 --
 _instance: SessionFactory | None = None
 
+# 모델에서 제거한 인덱스 이름이다 -- 기존 DB에 남아 쓰기 비용만 늘리지 않도록 시작 시 삭제한다
+_RETIRED_INDEXES: tuple[str, ...] = (
+    "ix_articles_content_hash",
+    "ix_universe_config_enabled",
+    "ix_indicator_history_ticker",
+    "ix_trades_ticker",
+    "ix_trades_side",
+    "ix_feedback_reports_report_type",
+    "ix_feedback_reports_report_date",
+)
+
 
 class Base(DeclarativeBase):
     """모든 ORM 모델의 기본 클래스이다.
@@ -39,6 +50,37 @@ class Base(DeclarativeBase):
     pass
 
 
+def _create_missing_indexes(sync_conn: Any) -> None:
+    """메타데이터에 선언되었지만 DB에 없는 인덱스를 생성한다.
+
+    SQLAlchemy 리플렉션은 표현식 인덱스를 건너뛰므로 checkfirst 대신
+    sqlite_master의 인덱스 이름으로 존재 여부를 판단한다.
+    """
+    existing = {
+        row[0] for row in sync_conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'index'",
+        )
+    }
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(sync_conn)
+                logger.info("누락 인덱스 생성: %s", index.name)
+
+
+def _drop_retired_indexes(sync_conn: Any) -> None:
+    """_RETIRED_INDEXES 중 DB에 남아 있는 인덱스를 삭제한다."""
+    existing = {
+        row[0] for row in sync_conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'index'",
+        )
+    }
+    for name in _RETIRED_INDEXES:
+        if name in existing:
+            sync_conn.exec_driver_sql(f'DROP INDEX IF EXISTS "{name}"')
+            logger.info("폐기 인덱스 삭제: %s", name)
+
+
 class SessionFactory:
     """DB 세션 팩토리 -- async with get_session() as session 패턴이다.
 
@@ -80,9 +122,16 @@ class SessionFactory:
         logger.info("DatabaseGateway 엔진 생성 완료 (SQLite WAL mode)")
 
     async def create_tables(self) -> None:
-        """SQLite 테이블을 생성한다. 이미 존재하는 테이블은 건너뛴다."""
+        """SQLite 테이블을 생성한다. 이미 존재하는 테이블은 건너뛴다.
+
+        create_all은 기존 테이블의 인덱스를 추가하거나 삭제하지 않으므로,
+        모델에 새로 선언된 인덱스는 별도로 존재 여부를 확인하여 생성하고
+        모델에서 제거된 인덱스(_RETIRED_INDEXES)는 삭제한다.
+        """
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(_create_missing_indexes)
+            await conn.run_sync(_drop_retired_indexes)
         logger.info("DatabaseGateway 테이블 생성/확인 완료")
 
     @asynccontextmanager
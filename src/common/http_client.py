@@ -10,17 +10,30 @@ import asyncio
 import json
 
 import aiohttp
+import orjson
 from pydantic import BaseModel
 
 from src.common.logger import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import aiodns  # noqa: F401
+    _HAS_AIODNS: bool = True
+except ImportError:
+    _HAS_AIODNS = False  # aiodns 미설치 시 aiohttp 기본(스레드풀) 리졸버로 폴백한다
+
 _instance: AsyncHttpClient | None = None
 _RETRYABLE_STATUS_CODES: set[int] = {500, 502, 503, 504}
 _MAX_RETRIES: int = 3
 _RETRY_BASE_DELAY: float = 1.0  # 지수 백오프 기준 간격(초)이다
 
+# 커넥션 풀 설정이다 -- 동일 호스트(FRED/Yahoo 등) 연속 요청 시 TLS 세션을 재사용한다
+_POOL_LIMIT: int = 100
+_POOL_LIMIT_PER_HOST: int = 10
+_DNS_CACHE_TTL: int = 300  # DNS 캐시 유지 시간(초)이다
+_KEEPALIVE_TIMEOUT: float = 30.0  # 유휴 커넥션 유지 시간(초)이다
+
 
 class TimeoutConfig(BaseModel):
     """HTTP 타임아웃 설정이다."""
@@ -35,8 +48,15 @@ class HttpResponse(BaseModel):
     headers: dict[str, str] = {}
 
     def json(self) -> dict:
-        """응답 본문을 JSON dict로 파싱한다."""
-        return json.loads(self.body)
+        """응답 본문을 JSON dict로 파싱한다.
+
+        표준 json보다 빠른 orjson을 먼저 쓰고, orjson이 거부하는 NaN/Infinity 리터럴이나
+        64비트를 넘는 정수가 든 본문은 표준 json으로 다시 파싱해 기존 동작을 유지한다.
+        """
+        try:
+            return orjson.loads(self.body)
+        except orjson.JSONDecodeError:
+            return json.loads(self.body)
 
     @property
     def ok(self) -> bool:
@@ -65,8 +85,15 @@ class AsyncHttpClient:
             timeout = aiohttp.ClientTimeout(
                 total=self._config.total, connect=self._config.connect,
             )
-            # TCP_NODELAY: 패킷 모으지 않고 즉시 전송하여 지연 최소화한다
+            # keep-alive 커넥션을 호스트별로 재사용하여 반복 TLS 핸드셰이크를 피한다
+            # aiodns가 있으면 스레드풀 대신 c-ares 비동기 리졸버로 DNS를 조회한다
+            resolver = aiohttp.AsyncResolver() if _HAS_AIODNS else None
             connector = aiohttp.TCPConnector(
+                resolver=resolver,
+                limit=_POOL_LIMIT,
+                limit_per_host=_POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT,
                 force_close=False,
                 enable_cleanup_closed=True,
             )
@@ -76,6 +103,14 @@ class AsyncHttpClient:
             )
         return self._session
 
+    async def session(self) -> aiohttp.ClientSession:
+        """풀링된 공유 세션을 반환한다.
+
+        바이트 본문 등 HttpResponse 래퍼가 다루지 않는 응답이 필요한 호출자용이다.
+        반환된 세션은 공유 자원이므로 호출자가 닫지 않는다.
+        """
+        return await self._ensure_session()
+
     async def _send_once(
         self, method: str, url: str, headers: dict | None = None,
         params: dict | None = None, json_data: dict | None = None,
@@ -83,53 +118,71 @@ class AsyncHttpClient:
     ) -> HttpResponse:
         """단일 HTTP 요청을 전송하고 HttpResponse를 반환한다."""
         session = await self._ensure_session()
-        resp = await session.request(
+        # 본문을 읽는 즉시 응답 컨텍스트를 빠져나와 커넥션을 풀에 반환한다
+        # 본문 읽기 중 예외가 나도 커넥션이 해제되어 재시도 요청이 keep-alive를 재사용한다
+        async with session.request(
             method, url, headers=headers,
             params=params, json=json_data, data=data,
-        )
-        body = await resp.text()
-        return HttpResponse(
-            status=resp.status, body=body, headers=dict(resp.headers),
-        )
+        ) as resp:
+            body = await resp.text()
+            return HttpResponse(
+                status=resp.status, body=body, headers=dict(resp.headers),
+            )
 
-    async def _wait_before_retry(self, method: str, url: str, attempt: int, reason: str) -> None:
+    async def _wait_before_retry(
+        self, method: str, url: str, attempt: int, max_retries: int, reason: str,
+    ) -> None:
         """재시도 전 지수 백오프 대기를 수행하고 로그를 남긴다."""
         delay = _RETRY_BASE_DELAY * (2 ** attempt)
         logger.debug(
             "%s %s %s (%.1f초 후 재시도 %d/%d)",
-            method, url, reason, delay, attempt + 1, _MAX_RETRIES,
+            method, url, reason, delay, attempt + 1, max_retries,
         )
         await asyncio.sleep(delay)
 
     async def _request(
         self, method: str, url: str, headers: dict | None = None,
         params: dict | None = None, json_data: dict | None = None,
-        data: str | None = None,
+        data: str | None = None, max_retries: int = _MAX_RETRIES,
     ) -> HttpResponse:
-        """HTTP 요청을 실행한다. 5xx 에러 시 지수 백오프 재시도를 수행한다."""
+        """HTTP 요청을 실행한다. 5xx 에러 시 지수 백오프 재시도를 수행한다.
+
+        max_retries는 총 시도 횟수이다. 1이면 재시도 없이 한 번만 보낸다.
+        """
         last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
+        for attempt in range(max_retries):
             try:
                 response = await self._send_once(method, url, headers, params, json_data, data)
                 if response.status not in _RETRYABLE_STATUS_CODES:
                     logger.debug("%s %s -> %d", method, url, response.status)
                     return response
-                if attempt == _MAX_RETRIES - 1:
+                if attempt == max_retries - 1:
                     logger.warning("%s %s -> %d (재시도 소진)", method, url, response.status)
                     return response
-                await self._wait_before_retry(method, url, attempt, f"-> {response.status}")
+                await self._wait_before_retry(
+                    method, url, attempt, max_retries, f"-> {response.status}",
+                )
             except aiohttp.ClientError as exc:
                 last_error = exc
-                if attempt == _MAX_RETRIES - 1:
+                if attempt == max_retries - 1:
                     raise HttpClientError(f"HTTP 요청 실패: {method} {url}", cause=exc) from exc
-                await self._wait_before_retry(method, url, attempt, f"네트워크 에러: {exc}")
+                await self._wait_before_retry(
+                    method, url, attempt, max_retries, f"네트워크 에러: {exc}",
+                )
         raise HttpClientError(f"HTTP 요청 재시도 소진: {method} {url}", cause=last_error)
 
     async def get(
         self, url: str, headers: dict | None = None, params: dict | None = None,
+        max_retries: int = _MAX_RETRIES,
     ) -> HttpResponse:
-        """GET 요청을 수행한다."""
-        return await self._request("GET", url, headers=headers, params=params)
+        """GET 요청을 수행한다.
+
+        자체 타임아웃(asyncio.wait_for)으로 감싸는 호출자는 max_retries=1로 5xx 백오프
+        재시도를 꺼서 재시도 대기가 타임아웃 예산을 소진하지 않게 한다.
+        """
+        return await self._request(
+            "GET", url, headers=headers, params=params, max_retries=max_retries,
+        )
 
     async def post(
         self, url: str, json: dict | None = None,
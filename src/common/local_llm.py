@@ -25,6 +25,11 @@ _QWEN_FILENAME: str = "Qwen2.5-7B-Instruct-Q4_K_M.gguf"
 _LLAMA_FILENAME: str = "Meta-Llama-3.1-8B-Instruct.Q4_K_M.gguf"
 _DEEPSEEK_FILENAME: str = "DeepSeek-R1-Distill-Llama-8B-Q4_K_M.gguf"
 
+# 응답 후처리 정규식이다 -- 추론 호출마다 쓰이므로 모듈 로드 시 한 번만 컴파일한다
+_THINK_BLOCK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)  # 닫힌 <think> 블록이다
+_THINK_OPEN_RE = re.compile(r"<think>.*", re.DOTALL)  # 닫히지 않은 <think> 꼬리이다
+_HANGUL_RE = re.compile(r"[가-힣]")
+
 
 def _bllossom_path() -> Path:
     """Bllossom 모델 경로를 반환한다."""
@@ -107,8 +112,8 @@ def _load_classifiers() -> dict[str, Any]:
 
 def _strip_thinking(text: str) -> str:
     """DeepSeek <think> 블록을 제거한다."""
-    cleaned = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
-    cleaned = re.sub(r"<think>.*", "", cleaned, flags=re.DOTALL).strip()
+    cleaned = _THINK_BLOCK_RE.sub("", text).strip()
+    cleaned = _THINK_OPEN_RE.sub("", cleaned).strip()
     return cleaned if cleaned else text
 
 
@@ -165,7 +170,7 @@ def _sync_translate(text: str, target_lang: str) -> str:
     if target_lang == "ko":
         korean_lines = [
             line.strip() for line in result.split("\n")
-            if line.strip() and re.search(r"[가-힣]", line)
+            if line.strip() and _HANGUL_RE.search(line)
         ]
         if korean_lines:
             return "\n".join(korean_lines)
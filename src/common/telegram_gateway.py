@@ -69,10 +69,10 @@ def _close_open_tags(chunk: str) -> str:
             # 열기 태그 — 태그 이름만 추출한다
             inner = tag_str[1:].rstrip(">").strip().split()[0].lower()
             open_tags.append(inner)
-    # 역순으로 닫기 태그를 추가한다
-    for tag_name in reversed(open_tags):
-        chunk += f"</{tag_name}>"
-    return chunk
+    # 역순으로 닫기 태그를 한 번에 이어 붙인다
+    if not open_tags:
+        return chunk
+    return chunk + "".join(f"</{tag_name}>" for tag_name in reversed(open_tags))
 
 
 def _reopen_tags(prev_chunk: str) -> str:
@@ -28,7 +28,7 @@ _STRIP_PARAMS: set[str] = {
 
 
 def _normalize_url(url: str) -> str:
-    """URL을 정규화한다. 추적 파라미터/www/trailing slash를 제거한다."""
+    """URL을 정규화한다. 추적 파라미터/www/trailing slash를 제거하고 쿼리 순서를 고정한다."""
     parsed = urlparse(url)
     # www. 제거
     host = parsed.hostname or ""
@@ -36,7 +36,8 @@ def _normalize_url(url: str) -> str:
         host = host[4:]
     # 추적 파라미터 제거
     params = parse_qs(parsed.query, keep_blank_values=False)
-    cleaned = {k: v for k, v in params.items() if k not in _STRIP_PARAMS}
+    # 파라미터 순서만 다른 동일 기사가 같은 해시를 갖도록 키 순으로 정렬한다
+    cleaned = sorted((k, v) for k, v in params.items() if k not in _STRIP_PARAMS)
     query = urlencode(cleaned, doseq=True) if cleaned else ""
     # trailing slash 제거
     path = parsed.path.rstrip("/")
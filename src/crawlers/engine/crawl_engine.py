@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from datetime import datetime, timezone
 
 from src.common.event_bus import EventBus, EventType
 from src.common.logger import get_logger
@@ -126,16 +127,22 @@ class CrawlEngine:
     ) -> int:
         """기사를 검증하고 중복을 제거한 뒤 이벤트를 발행한다."""
         new_count = 0
+        # 배치 전체가 동일한 기준 시각으로 나이 검증을 받도록 한 번만 계산한다
+        now = datetime.now(tz=timezone.utc)
+        # 기사마다 반복되는 속성 조회를 피하도록 바운드 메서드를 지역 변수로 묶는다
+        verify = self._verifier.verify
+        check = self._dedup.check
+        publish = self._publish_article
         for article in articles:
-            verified = self._verifier.verify(article)
+            verified = verify(article, now)
             if verified is None:
                 continue
 
-            dedup_result = await self._dedup.check(verified)
+            dedup_result = await check(verified)
             if not dedup_result.is_new:
                 continue
 
-            await self._publish_article(verified)
+            await publish(verified)
             new_count += 1
 
         return new_count
@@ -1,13 +1,24 @@
-"""F1 데이터 수집 -- 공용 Pydantic 모델이다."""
+"""F1 데이터 수집 -- 공용 Pydantic 모델이다.
+
+RawArticle만 예외적으로 slots dataclass이다. 크롤러마다 수백 건씩 생성되고
+검증기에서 곧바로 소비되는 임시 객체이므로 검증/직렬화 비용을 생략한다.
+"""
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
 
 
 class SourceConfig(BaseModel):
-    """크롤러 소스 설정이다."""
+    """크롤러 소스 설정이다.
+
+    스케줄러의 모듈 수준 소스 테이블을 모든 스케줄과 크롤러가 공유하므로
+    불변(frozen)으로 선언한다. 값을 바꿔야 하면 model_copy(update=...)를 사용한다.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     name: str
     url: str
@@ -17,8 +28,12 @@ class SourceConfig(BaseModel):
     enabled: bool = True
 
 
-class RawArticle(BaseModel):
-    """크롤러에서 수집된 원시 기사이다."""
+@dataclass(slots=True)
+class RawArticle:
+    """크롤러에서 수집된 원시 기사이다.
+
+    타입 검증을 하지 않으므로 필드 정합성은 CrawlVerifier가 확인한다.
+    """
 
     title: str
     content: str
@@ -26,7 +41,7 @@ class RawArticle(BaseModel):
     source: str
     published_at: datetime | None = None
     language: str = "en"
-    metadata: dict = Field(default_factory=dict)
+    metadata: dict = field(default_factory=dict)
 
 
 class VerifiedArticle(BaseModel):
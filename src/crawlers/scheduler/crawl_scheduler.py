@@ -5,6 +5,8 @@ fast mode에서는 우선순위 높은 8개 소스만 짧은 타임아웃으로
 """
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from src.common.logger import get_logger
 from src.common.market_clock import MarketClock, TimeInfo
 from src.crawlers.models import CrawlSchedule, SourceConfig
@@ -33,7 +35,7 @@ _DAY_INTERVALS: dict[str, int] = {
 }
 
 # 전체 소스 정의이다 (30개)
-_ALL_SOURCES: list[SourceConfig] = [
+_ALL_SOURCES: tuple[SourceConfig, ...] = (
     # RSS 소스 (15개)
     SourceConfig(name="reuters", url="https://www.reutersagency.com/feed/", source_type="rss", priority=1),
     SourceConfig(name="bloomberg_rss", url="https://feeds.bloomberg.com/markets/news.rss", source_type="rss", priority=1),
@@ -67,7 +69,7 @@ _ALL_SOURCES: list[SourceConfig] = [
     SourceConfig(name="theblock", url="https://www.theblock.co/latest", source_type="scraping", priority=8, enabled=False),
     SourceConfig(name="cointelegraph", url="https://cointelegraph.com/rss", source_type="scraping", priority=8, enabled=False),
     SourceConfig(name="nasdaq_news", url="https://www.nasdaq.com/news-and-insights", source_type="scraping", priority=6, enabled=False),
-]
+)
 
 
 def _is_night_mode(time_info: TimeInfo) -> bool:
@@ -75,18 +77,30 @@ def _is_night_mode(time_info: TimeInfo) -> bool:
     return time_info.is_trading_window
 
 
-def _filter_enabled(sources: list[SourceConfig]) -> list[SourceConfig]:
+def _filter_enabled(sources: Sequence[SourceConfig]) -> list[SourceConfig]:
     """활성화된 소스만 필터링한다."""
     return [s for s in sources if s.enabled]
 
 
-def _apply_fast_mode(sources: list[SourceConfig]) -> list[SourceConfig]:
+# 소스 정의는 런타임에 바뀌지 않으므로 활성 소스 목록을 모듈 로드 시 한 번만 계산한다
+# 우선순위 순(동순위는 정의 순)으로 정렬해 두어 CrawlEngine이 priority 1 소스의 태스크를
+# 먼저 생성하고, 수집 결과도 이 순서로 검증/발행되어 핵심 뉴스가 먼저 전파된다
+_ENABLED_SOURCES: tuple[SourceConfig, ...] = tuple(
+    sorted(_filter_enabled(_ALL_SOURCES), key=lambda s: s.priority),
+)
+
+
+def _apply_fast_mode(sources: Sequence[SourceConfig]) -> list[SourceConfig]:
     """fast mode: 우선순위 상위 8개 소스만 선택하고 타임아웃을 5초로 설정한다."""
     sorted_sources = sorted(sources, key=lambda s: s.priority)
     top_sources = sorted_sources[:_FAST_MODE_MAX_SOURCES]
     return [s.model_copy(update={"timeout": _FAST_MODE_TIMEOUT}) for s in top_sources]
 
 
+# fast mode 소스도 입력이 고정이므로 우선순위 정렬과 타임아웃 복사를 로드 시 한 번만 수행한다
+_FAST_MODE_SOURCES: tuple[SourceConfig, ...] = tuple(_apply_fast_mode(_ENABLED_SOURCES))
+
+
 class CrawlScheduler:
     """KST 시각 기반 크롤링 스케줄러이다.
 
@@ -104,9 +118,7 @@ class CrawlScheduler:
         is_night = _is_night_mode(time_info)
         intervals = _NIGHT_INTERVALS if is_night else _DAY_INTERVALS
 
-        sources = _filter_enabled(_ALL_SOURCES)
-        if fast_mode:
-            sources = _apply_fast_mode(sources)
+        sources = list(_FAST_MODE_SOURCES if fast_mode else _ENABLED_SOURCES)
 
         logger.info(
             "스케줄 생성: session=%s, night=%s, fast=%s, sources=%d",
@@ -50,6 +50,9 @@ _PARAM_NAME_MAP: dict[str, str] = {
     "stocktwits": "access_token",
 }
 
+# 메시지 ID 커서(since)를 지원하는 소스이다 -- 직전 최대 ID 이후 메시지만 받는다
+_SINCE_CURSOR_SOURCES: set[str] = {"stocktwits"}
+
 
 class ApiCrawler(CrawlerBase):
     """API 기반 크롤러이다. 7개 API 소스를 처리한다."""
@@ -60,13 +63,19 @@ class ApiCrawler(CrawlerBase):
         """HTTP 클라이언트와 시크릿 제공자를 주입받는다."""
         super().__init__(http_client)
         self._vault = vault
+        # 소스별 마지막 메시지 ID이다 -- 다음 요청에 since로 전달한다
+        self._since_ids: dict[str, int] = {}
 
     def can_handle(self, source: SourceConfig) -> bool:
         """이 크롤러가 해당 소스를 처리할 수 있는지 판별한다."""
         return source.name in _API_SOURCES
 
     async def crawl(self, source: SourceConfig) -> list[RawArticle]:
-        """API 엔드포인트를 호출하고 응답을 RawArticle 목록으로 변환한다."""
+        """API 엔드포인트를 호출하고 응답을 RawArticle 목록으로 변환한다.
+
+        since 커서를 지원하는 소스는 직전 응답의 최대 메시지 ID 이후분만 요청하여
+        이미 본 메시지의 전송과 파싱을 건너뛴다.
+        """
         params = self._build_params(source)
         response = await self._http.get(source.url, params=params)
 
@@ -74,9 +83,15 @@ class ApiCrawler(CrawlerBase):
             logger.warning(
                 "API 응답 실패: %s status=%d", source.name, response.status,
             )
+            # 커서가 만료/무효일 수 있으므로 다음 요청은 전체 스트림부터 다시 받는다
+            self._since_ids.pop(source.name, None)
             return []
 
-        return self._parse_response(source.name, response.json())
+        data = response.json()
+        articles = self._parse_response(source.name, data)
+        if source.name in _SINCE_CURSOR_SOURCES:
+            self._remember_since_id(source.name, data)
+        return articles
 
     def _build_params(self, source: SourceConfig) -> dict[str, str]:
         """소스별 쿼리 파라미터를 구성한다. API 키를 주입한다."""
@@ -87,8 +102,20 @@ class ApiCrawler(CrawlerBase):
             if api_key:
                 param_name = _PARAM_NAME_MAP.get(source.name, "apikey")
                 params[param_name] = api_key
+        since_id = self._since_ids.get(source.name)
+        if since_id is not None:
+            params["since"] = str(since_id)
         return params
 
+    def _remember_since_id(self, source_name: str, data: dict | list) -> None:
+        """응답 메시지의 최대 ID를 다음 요청의 since 커서로 저장한다."""
+        messages = data.get("messages") if isinstance(data, dict) else None
+        if not messages:
+            return  # 신규 메시지가 없으면 기존 커서를 유지한다
+        ids = [m["id"] for m in messages if isinstance(m.get("id"), int)]
+        if ids:
+            self._since_ids[source_name] = max(ids)
+
     def _parse_response(
         self, source_name: str, data: dict | list,
     ) -> list[RawArticle]:
@@ -22,11 +22,14 @@ def _ts_to_dt(ts: int | None) -> datetime | None:
 
 
 def _safe_parse_iso(raw: str | None) -> datetime | None:
-    """ISO 형식 날짜 문자열을 안전하게 파싱한다."""
+    """ISO 형식 날짜 문자열을 안전하게 파싱한다.
+
+    Python 3.11+ fromisoformat은 끝의 'Z'를 UTC로 직접 해석하므로 치환하지 않는다.
+    """
     if not raw:
         return None
     try:
-        return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        return datetime.fromisoformat(raw)
     except ValueError:
         return None
 
@@ -70,20 +73,24 @@ def parse_fred(data: dict) -> list[RawArticle]:
     if not observations:
         return []
     latest = observations[-1]
+    # 제목/본문/발행일에 반복 사용하는 필드를 한 번만 조회한다
+    get = latest.get
+    value, date = get("value", "N/A"), get("date")
     return [RawArticle(
-        title=f"FRED 경제지표 업데이트: {latest.get('value', 'N/A')}",
-        content=f"Date: {latest.get('date')}, Value: {latest.get('value')}",
+        title=f"FRED 경제지표 업데이트: {value}",
+        content=f"Date: {date}, Value: {value}",
         url="https://fred.stlouisfed.org",
         source="fred",
-        published_at=_safe_parse_iso(latest.get("date")),
+        published_at=_safe_parse_iso(date),
         metadata={"data_type": "economic_indicator"},
     )]
 
 
 def parse_feargreed(data: dict) -> list[RawArticle]:
     """CNN Fear & Greed Index 응답을 파싱한다."""
-    score = data.get("fear_and_greed", {}).get("score")
-    rating = data.get("fear_and_greed", {}).get("rating", "unknown")
+    fear_greed = data.get("fear_and_greed", {})
+    score = fear_greed.get("score")
+    rating = fear_greed.get("rating", "unknown")
     if score is None:
         return []
     return [RawArticle(
@@ -101,9 +108,10 @@ def parse_finviz(data: dict | list) -> list[RawArticle]:
     items = data if isinstance(data, list) else data.get("news", [])
     articles: list[RawArticle] = []
     for item in items:
+        title = item.get("title", "")
         articles.append(RawArticle(
-            title=item.get("title", ""),
-            content=item.get("title", ""),
+            title=title,
+            content=title,
             url=item.get("link", item.get("url", "")),
             source="finviz",
             published_at=_safe_parse_iso(item.get("date")),
@@ -116,9 +124,10 @@ def parse_stocktwits(data: dict) -> list[RawArticle]:
     messages = data.get("messages", [])
     articles: list[RawArticle] = []
     for msg in messages:
+        body = msg.get("body", "")
         articles.append(RawArticle(
-            title=msg.get("body", "")[:100],
-            content=msg.get("body", ""),
+            title=body[:100],
+            content=body,
             url=f"https://stocktwits.com/message/{msg.get('id', '')}",
             source="stocktwits",
             published_at=_safe_parse_iso(msg.get("created_at")),
@@ -132,9 +141,10 @@ def parse_dart(data: dict) -> list[RawArticle]:
     items = data.get("list", [])
     articles: list[RawArticle] = []
     for item in items:
+        report_nm = item.get("report_nm", "")
         articles.append(RawArticle(
-            title=item.get("report_nm", ""),
-            content=f"{item.get('corp_name', '')}: {item.get('report_nm', '')}",
+            title=report_nm,
+            content=f"{item.get('corp_name', '')}: {report_nm}",
             url=f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={item.get('rcept_no', '')}",
             source="dart",
             published_at=_safe_parse_iso(item.get("rcept_dt")),
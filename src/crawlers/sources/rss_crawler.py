@@ -7,7 +7,9 @@ nikkei_asia, scmp, yonhap_en, hankyung, mk)를 처리한다.
 """
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from calendar import timegm
+from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 
 import feedparser
@@ -29,9 +31,22 @@ _RSS_SOURCES: set[str] = {
 # 한국어 소스 이름 -- language 태그용이다
 _KOREAN_SOURCES: set[str] = {"hankyung", "mk"}
 
+# 변경 없음 응답 코드이다 (조건부 GET)
+_NOT_MODIFIED: int = 304
+
 
 def _parse_pub_date(entry: dict) -> datetime | None:
-    """RSS entry에서 발행일을 파싱한다. 실패 시 None을 반환한다."""
+    """RSS entry에서 발행일을 파싱한다. 실패 시 None을 반환한다.
+
+    feedparser가 이미 UTC struct_time으로 파싱해 둔 값을 우선 사용하여
+    날짜 문자열을 다시 파싱하지 않는다.
+    """
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if parsed:
+        try:
+            return datetime.fromtimestamp(timegm(parsed), tz=timezone.utc)
+        except (OverflowError, ValueError, OSError):
+            pass
     raw = entry.get("published") or entry.get("updated")
     if not raw:
         return None
@@ -57,15 +72,15 @@ def _detect_language(source_name: str) -> str:
     return "en"
 
 
-def _entry_to_raw_article(entry: dict, source: SourceConfig) -> RawArticle:
-    """feedparser entry를 RawArticle로 변환한다."""
+def _entry_to_raw_article(entry: dict, source: SourceConfig, language: str) -> RawArticle:
+    """feedparser entry를 RawArticle로 변환한다. language는 피드 단위로 한 번 판별한 값이다."""
     return RawArticle(
         title=entry.get("title", ""),
         content=_extract_content(entry),
         url=entry.get("link", ""),
         source=source.name,
         published_at=_parse_pub_date(entry),
-        language=_detect_language(source.name),
+        language=language,
         metadata={"source_type": "rss"},
     )
 
@@ -76,21 +91,57 @@ class RssCrawler(CrawlerBase):
     def __init__(self, http_client: AsyncHttpClient) -> None:
         """HTTP 클라이언트를 주입받아 초기화한다."""
         super().__init__(http_client)
+        # URL별 조건부 GET 검증자이다 (ETag, Last-Modified)
+        self._etags: dict[str, str] = {}
+        self._last_modified: dict[str, str] = {}
 
     def can_handle(self, source: SourceConfig) -> bool:
         """이 크롤러가 해당 소스를 처리할 수 있는지 판별한다."""
         return source.name in _RSS_SOURCES
 
     async def crawl(self, source: SourceConfig) -> list[RawArticle]:
-        """RSS 피드를 가져와 RawArticle 목록으로 변환한다."""
-        response = await self._http.get(source.url)
+        """RSS 피드를 가져와 RawArticle 목록으로 변환한다.
+
+        이전 응답의 ETag/Last-Modified로 조건부 GET을 보내
+        피드가 바뀌지 않았으면(304) 본문 전송과 파싱을 건너뛴다.
+        """
+        url = source.url
+        response = await self._http.get(url, headers=self._conditional_headers(url))
+        if response.status == _NOT_MODIFIED:
+            logger.debug("RSS 변경 없음 (304): %s", source.name)
+            return []
         if not response.ok:
             logger.warning(
                 "RSS 응답 실패: %s status=%d", source.name, response.status,
             )
             return []
 
-        return self._parse_feed(response.body, source)
+        # feedparser는 순수 파이썬 XML 파서이므로 이벤트 루프를 막지 않도록 스레드에서 실행한다
+        articles = await asyncio.to_thread(self._parse_feed, response.body, source)
+        # 파싱까지 끝난 응답만 검증자로 기억하여 실패한 피드가 304로 묻히지 않게 한다
+        self._remember_validators(url, response.headers)
+        return articles
+
+    def _conditional_headers(self, url: str) -> dict[str, str] | None:
+        """저장된 검증자로 조건부 요청 헤더를 만든다. 없으면 None이다."""
+        headers: dict[str, str] = {}
+        etag = self._etags.get(url)
+        if etag:
+            headers["If-None-Match"] = etag
+        last_modified = self._last_modified.get(url)
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers or None
+
+    def _remember_validators(self, url: str, headers: dict[str, str]) -> None:
+        """200 응답의 ETag/Last-Modified를 저장한다. 헤더 이름 대소문자는 무시한다."""
+        lowered = {k.lower(): v for k, v in headers.items()}
+        etag = lowered.get("etag")
+        if etag:
+            self._etags[url] = etag
+        last_modified = lowered.get("last-modified")
+        if last_modified:
+            self._last_modified[url] = last_modified
 
     def _parse_feed(self, body: str, source: SourceConfig) -> list[RawArticle]:
         """RSS XML 본문을 파싱하여 RawArticle 목록을 반환한다."""
@@ -100,8 +151,10 @@ class RssCrawler(CrawlerBase):
             return []
 
         articles: list[RawArticle] = []
+        # 언어는 소스에 따라 정해지므로 피드당 한 번만 판별한다
+        language = _detect_language(source.name)
         for entry in feed.entries:
-            article = _entry_to_raw_article(entry, source)
+            article = _entry_to_raw_article(entry, source, language)
             if article.title and article.url:
                 articles.append(article)
 
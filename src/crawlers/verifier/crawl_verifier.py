@@ -42,11 +42,10 @@ def _compute_content_hash(title: str, url: str) -> str:
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
-def _is_within_age_limit(published_at: datetime | None) -> bool:
-    """발행일이 24시간 이내인지 검증한다. None이면 통과시킨다."""
+def _is_within_age_limit(published_at: datetime | None, now: datetime) -> bool:
+    """발행일이 now 기준 24시간 이내인지 검증한다. None이면 통과시킨다."""
     if published_at is None:
         return True
-    now = datetime.now(tz=timezone.utc)
     # timezone-naive인 경우 UTC로 간주한다
     if published_at.tzinfo is None:
         published_at = published_at.replace(tzinfo=timezone.utc)
@@ -56,7 +55,7 @@ def _is_within_age_limit(published_at: datetime | None) -> bool:
 def _calculate_quality_score(article: RawArticle) -> float:
     """기사 품질 점수(0.0~1.0)를 계산한다."""
     # 본문 길이 점수: 길수록 높지만 _CONTENT_LENGTH_CAP에서 포화한다
-    content_ratio = min(len(article.content) / _CONTENT_LENGTH_CAP, 1.0)
+    content_ratio = min(len(article.content or "") / _CONTENT_LENGTH_CAP, 1.0)
     content_score = content_ratio * _SCORE_WEIGHTS["content_length"]
 
     # 발행일 존재 여부 점수
@@ -70,8 +69,12 @@ def _calculate_quality_score(article: RawArticle) -> float:
 
 
 def _check_required_fields(article: RawArticle) -> bool:
-    """필수 필드(title, url)가 비어있지 않은지 검증한다."""
-    return bool(article.title.strip() and article.url.strip())
+    """필수 필드(title, url)가 비어있지 않은 문자열인지 검증한다."""
+    title, url = article.title, article.url
+    return (
+        isinstance(title, str) and isinstance(url, str)
+        and bool(title.strip() and url.strip())
+    )
 
 
 class CrawlVerifier:
@@ -81,17 +84,22 @@ class CrawlVerifier:
     본문 길이는 quality_score에만 반영하고 하드 필터링하지 않는다.
     """
 
-    def verify(self, article: RawArticle) -> VerifiedArticle | None:
+    def verify(
+        self, article: RawArticle, now: datetime | None = None,
+    ) -> VerifiedArticle | None:
         """기사를 검증한다. 통과 시 VerifiedArticle, 실패 시 None을 반환한다.
 
         제목+URL만 있으면 유효하다. 본문 길이는 quality_score에 반영될 뿐
         하드 필터로 사용하지 않는다 (Finviz/FRED/FearGreed 등 짧은 속보 보존).
+        배치 검증 시 호출자가 now를 한 번 계산해 넘기면 기사마다 시계를 읽지 않는다.
         """
         if not _check_required_fields(article):
             logger.debug("필수 필드 누락: %s", article.url)
             return None
 
-        if not _is_within_age_limit(article.published_at):
+        if now is None:
+            now = datetime.now(tz=timezone.utc)
+        if not _is_within_age_limit(article.published_at, now):
             logger.debug("24시간 초과 기사: %s", article.url)
             return None
 
@@ -99,13 +107,13 @@ class CrawlVerifier:
         quality_score = _calculate_quality_score(article)
 
         # 발행일이 없으면 현재 시각을 사용한다
-        published = article.published_at or datetime.now(tz=timezone.utc)
+        published = article.published_at or now
         if published.tzinfo is None:
             published = published.replace(tzinfo=timezone.utc)
 
         return VerifiedArticle(
             title=article.title,
-            content=article.content,
+            content=article.content or "",
             url=article.url,
             source=article.source,
             published_at=published,
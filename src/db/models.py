@@ -10,6 +10,8 @@ Alembic 마이그레이션은 참조용으로 유지한다. 기존 DB 테이블
 """
 from __future__ import annotations
 
+import os
+import time
 import uuid
 
 from datetime import datetime, timezone
@@ -20,6 +22,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     Float,
+    Index,
     Integer,
     JSON,
     String,
@@ -31,9 +34,26 @@ from sqlalchemy.orm import Mapped, mapped_column
 from src.common.database_gateway import Base
 
 
+_UUID7_TS_MASK: int = (1 << 48) - 1  # 48비트 밀리초 타임스탬프 마스크이다
+_UUID7_RAND_B_MASK: int = (1 << 62) - 1  # 62비트 rand_b 마스크이다
+
+
 def _uuid() -> str:
-    """새 UUID 문자열을 생성한다."""
-    return str(uuid.uuid4())
+    """시간순 정렬되는 UUIDv7(RFC 9562) 문자열을 생성한다.
+
+    무작위 uuid4는 PK 인덱스 B-tree 전역에 흩어져 삽입되므로 페이지 분할과
+    캐시 미스가 잦다. 상위 48비트를 밀리초 타임스탬프로 채워 삽입이 인덱스 끝에 몰리게 한다.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")  # 80비트 난수이다
+    value = (
+        (ts_ms & _UUID7_TS_MASK) << 80
+        | 0x7 << 76                      # version 7
+        | (rand >> 68) << 64             # rand_a 12비트
+        | 0b10 << 62                     # RFC 4122 variant
+        | (rand & _UUID7_RAND_B_MASK)    # rand_b 62비트
+    )
+    return str(uuid.UUID(int=value))
 
 
 # ── 1. 수집된 기사 ──
@@ -45,19 +65,35 @@ class Article(Base):
     url = Column(String, unique=True)
     source = Column(String)
     published_at = Column(DateTime(timezone=True), index=True)
-    content_hash = Column(String, index=True)
+    # 단건 해시 조회 경로가 없으므로 전체 컬럼 인덱스 대신 아래 부분 커버링 인덱스만 둔다
+    content_hash = Column(String)
     impact_score = Column(Float, default=0.0)
     direction = Column(String, default="neutral")
     category = Column(String, default="")
     created_at = Column(DateTime(timezone=True), server_default=text("(datetime('now'))"))
 
+    __table_args__ = (
+        # 뉴스 API가 date(published_at) = ? 로 일별 조회하므로 표현식 인덱스로 전체 스캔을 피한다
+        # published_at을 두 번째 키로 두어 ORDER BY published_at DESC를 정렬 없이 역방향 스캔으로 처리한다
+        Index("idx_articles_published_date", text("date(published_at)"), "published_at"),
+        # 재시작 시 dedup 캐시 예열 쿼리(created_at >= ? AND content_hash IS NOT NULL) 전용
+        # 부분 인덱스이다. 해시가 있는 행만 담고 content_hash까지 포함해 테이블 접근 없이 끝난다
+        Index(
+            "idx_articles_recent_hash", "created_at", "content_hash",
+            sqlite_where=text("content_hash IS NOT NULL"),
+        ),
+    )
+
 
 # ── 2. 매매 기록 ──
 class Trade(Base):
     __tablename__ = "trades"
     id = Column(String, primary_key=True, default=_uuid)
-    ticker = Column(String, nullable=False, index=True)
-    side = Column(String, nullable=False, index=True)
+    # 거래 조회(ML 학습 데이터, tax_writer 세금 집계)는 모두 created_at 범위 + ORDER BY created_at이다
+    # side는 buy/sell 두 값뿐이라 created_at 인덱스로 범위를 좁힌 뒤 필터하는 편이 낫고,
+    # ticker로 거래를 조회하는 경로는 없으므로 ticker/side 단독 인덱스는 두지 않는다
+    ticker = Column(String, nullable=False)
+    side = Column(String, nullable=False)
     quantity = Column(Integer, nullable=False)
     price = Column(Float, nullable=False)
     order_id = Column(String, default="")
@@ -69,7 +105,8 @@ class Trade(Base):
 class IndicatorHistory(Base):
     __tablename__ = "indicator_history"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    ticker = Column(String, nullable=False, index=True)
+    # 유일한 조회 경로(ML 학습 데이터 수집)는 recorded_at 범위 스캔이므로 ticker 단독 인덱스는 두지 않는다
+    ticker = Column(String, nullable=False)
     indicator_name = Column(String, nullable=False)
     value = Column(Float)
     recorded_at = Column(DateTime(timezone=True), index=True)
@@ -91,11 +128,16 @@ class StrategyParamHistory(Base):
 class FeedbackReport(Base):
     __tablename__ = "feedback_reports"
     id = Column(String, primary_key=True, default=_uuid)
-    report_type = Column(String, default="daily", index=True)
-    report_date = Column(Date, index=True)
+    report_type = Column(String, default="daily")
+    report_date = Column(Date)
     content = Column(JSON, default=dict)
     created_at = Column(DateTime(timezone=True), server_default=text("(datetime('now'))"))
 
+    __table_args__ = (
+        # report_date = ? ORDER BY report_type DESC 와 최신 report_date 조회를 복합 인덱스 하나로 처리한다
+        Index("idx_feedback_reports_date_type", "report_date", "report_type"),
+    )
+
 
 # ── 6. 크롤링 체크포인트 ──
 class CrawlCheckpoint(Base):
@@ -216,7 +258,8 @@ class UniverseConfig(Base):
     leverage: Mapped[float] = mapped_column(Float, nullable=False, default=2.0)
     is_inverse: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     pair_ticker: Mapped[str | None] = mapped_column(String(20), nullable=True)
-    enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, index=True)
+    # 유니버스는 항상 전체를 id 순으로 읽으므로 저선택도 boolean 인덱스는 두지 않는다
+    enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=text("(datetime('now'))")
     )
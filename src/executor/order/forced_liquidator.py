@@ -63,22 +63,18 @@ async def force_liquidate_all(
                 "청산 실패: %s %d주 -> %s", ticker, pos.quantity, result.message,
             )
 
-    # 청산 완료 후 이벤트 발행
-    event_bus = get_event_bus()
-    await event_bus.publish(
-        EventType.EMERGENCY_LIQUIDATION,
-        LiquidationResult(
-            liquidated=liquidated, failed=failed, total_value=total_value,
-        ),
+    # 청산 완료 후 이벤트 발행 -- 발행과 반환에 같은 결과 객체를 쓰도록 한 번만 생성한다
+    summary = LiquidationResult(
+        liquidated=liquidated, failed=failed, total_value=total_value,
     )
+    event_bus = get_event_bus()
+    await event_bus.publish(EventType.EMERGENCY_LIQUIDATION, summary)
 
     logger.warning(
         "강제 청산 완료: 성공=%d, 실패=%d, 총액=$%.2f",
         len(liquidated), len(failed), total_value,
     )
-    return LiquidationResult(
-        liquidated=liquidated, failed=failed, total_value=total_value,
-    )
+    return summary
 
 
 async def force_liquidate_ticker(
@@ -0,0 +1,28 @@
+"""스크래핑 요청 시작 간격을 보장하는 비동기 게이트 모듈이다.
+
+동일 호스트에 대한 요청을 asyncio.gather로 병렬 전송하면서도,
+요청 시작 시각 사이에 최소 간격을 두어 rate limit을 지킨다.
+응답 대기는 서로 겹치므로 순차 요청 + 고정 sleep보다 전체 소요 시간이 짧다.
+"""
+from __future__ import annotations
+
+import asyncio
+
+
+class RequestPacer:
+    """요청 시작 시각 간 최소 간격을 보장하는 게이트이다."""
+
+    def __init__(self, interval: float) -> None:
+        """최소 시작 간격(초)을 설정한다."""
+        self._interval = interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        """직전 요청 시작 후 interval이 지날 때까지 대기한 뒤 반환한다."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = loop.time() + self._interval
@@ -20,6 +20,7 @@ import re
 from typing import TYPE_CHECKING, Any
 
 from src.common.logger import get_logger
+from src.indicators.external._request_pacer import RequestPacer
 
 if TYPE_CHECKING:
     from src.common.cache_gateway import CacheClient
@@ -91,10 +92,15 @@ _HOLDINGS_TABLE_PATTERN = re.compile(
     re.DOTALL,
 )
 
+# 테이블 행/셀/태그 추출 패턴이다 — 행마다 재사용하므로 모듈 로드 시 한 번만 컴파일한다
+_ROW_PATTERN = re.compile(r'<tr[^>]*>(.*?)</tr>', re.DOTALL)
+_CELL_PATTERN = re.compile(r'<td[^>]*>(.*?)</td>', re.DOTALL)
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+
 
 def _clean_text(text: str) -> str:
     """HTML 태그를 제거하고 공백을 정리한다."""
-    cleaned = re.sub(r'<[^>]+>', '', text)
+    cleaned = _TAG_PATTERN.sub('', text)
     return cleaned.strip()
 
 
@@ -128,11 +134,11 @@ def _parse_holdings_html(html: str) -> list[dict[str, Any]]:
     table_html = table_match.group(1)
 
     # 모든 <tr>을 추출한다
-    rows = re.findall(r'<tr[^>]*>(.*?)</tr>', table_html, re.DOTALL)
+    rows = _ROW_PATTERN.findall(table_html)
 
     for row in rows:
         # td 셀들을 추출한다
-        cells = re.findall(r'<td[^>]*>(.*?)</td>', row, re.DOTALL)
+        cells = _CELL_PATTERN.findall(row)
         if len(cells) < 7:
             # 헤더 행이거나 불완전한 행은 건너뛴다
             continue
@@ -285,11 +291,24 @@ class DataromaFetcher:
         }
 
     async def _fetch_all_investors(self) -> dict[str, Any]:
-        """모든 추적 대상 투자자의 보유 현황을 수집한다."""
-        investors_data: list[dict[str, Any]] = []
+        """모든 추적 대상 투자자의 보유 현황을 수집한다.
+
+        요청 시작 간격만 _INTER_INVESTOR_DELAY로 유지하고 응답 대기는 겹치게 하여
+        이전 요청이 끝날 때까지 기다리지 않는다.
+        """
+        # 투자자 간 요청 지연 — rate limit 방지 (시작 시각 기준)
+        pacer = RequestPacer(_INTER_INVESTOR_DELAY)
 
-        for i, investor in enumerate(_INVESTORS):
-            holdings = await self._fetch_investor(investor["code"])
+        async def _paced_fetch(code: str) -> list[dict[str, Any]] | None:
+            await pacer.wait()
+            return await self._fetch_investor(code)
+
+        results = await asyncio.gather(
+            *(_paced_fetch(investor["code"]) for investor in _INVESTORS),
+        )
+
+        investors_data: list[dict[str, Any]] = []
+        for investor, holdings in zip(_INVESTORS, results):
             if holdings is not None:
                 investors_data.append({
                     "name": investor["name"],
@@ -299,10 +318,6 @@ class DataromaFetcher:
                     "holdings": holdings,
                 })
 
-            # 투자자 간 요청 지연 — rate limit 방지
-            if i < len(_INVESTORS) - 1:
-                await asyncio.sleep(_INTER_INVESTOR_DELAY)
-
         # 요약 정보 생성
         summary = _build_summary(investors_data)
 
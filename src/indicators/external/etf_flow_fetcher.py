@@ -11,6 +11,7 @@ import re
 from typing import TYPE_CHECKING, Any
 
 from src.common.logger import get_logger
+from src.indicators.external._request_pacer import RequestPacer
 
 if TYPE_CHECKING:
     from src.common.cache_gateway import CacheClient
@@ -279,15 +280,19 @@ class EtfFlowFetcher:
             logger.debug("ETF 플로우 캐시 히트: %d 티커", len(cached))
             return cached
 
-        # 순차적으로 각 티커를 스크래핑한다 — rate limit 방지
+        # 요청 시작 간격만 유지하며 티커를 병렬로 스크래핑한다 — rate limit 방지
+        pacer = RequestPacer(_INTER_REQUEST_DELAY)
+
+        async def _paced_fetch(ticker: str) -> dict[str, Any]:
+            await pacer.wait()
+            return await self._fetch_ticker(ticker)
+
+        fetched = await asyncio.gather(*(_paced_fetch(t) for t in _TARGET_TICKERS))
+
         results: dict[str, dict[str, Any]] = {}
-        for i, ticker in enumerate(_TARGET_TICKERS):
-            data = await self._fetch_ticker(ticker)
+        for ticker, data in zip(_TARGET_TICKERS, fetched):
             if data and len(data) > 1:  # ticker 필드 외에 데이터가 있어야 유효
                 results[ticker] = data
-            # 마지막 티커 이후에는 딜레이 불필요
-            if i < len(_TARGET_TICKERS) - 1:
-                await asyncio.sleep(_INTER_REQUEST_DELAY)
 
         if results:
             await self._write_all_to_cache(results)
@@ -288,11 +288,11 @@ class MacrotrendsFetcher:
             logger.debug("Macrotrends %s — 회사명 매핑 없음", ticker)
             return None
 
-        # P/E ratio 페이지 스크래핑
-        pe_data = await self._scrape_pe_page(ticker, company)
-
-        # Revenue 페이지 스크래핑
-        revenue_growth = await self._scrape_revenue_page(ticker, company)
+        # P/E ratio 페이지와 Revenue 페이지는 서로 독립이므로 동시에 스크래핑한다
+        pe_data, revenue_growth = await asyncio.gather(
+            self._scrape_pe_page(ticker, company),
+            self._scrape_revenue_page(ticker, company),
+        )
 
         # 데이터가 하나라도 있으면 결과를 구성한다
         if pe_data is None and revenue_growth is None:
@@ -8,9 +8,12 @@ API 키 불필요. events 엔드포인트로 전체 조회 후 클라이언트 
 from __future__ import annotations
 
 import asyncio
-import json
+import heapq
+import re
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 from src.common.logger import get_logger
 
 if TYPE_CHECKING:
@@ -29,18 +32,22 @@ _LAST_SUCCESS_KEY: str = "prediction:polymarket:last_success"
 _LAST_SUCCESS_TTL: int = 86400  # 24시간 폴백 유지
 
 # 매매에 영향을 주는 키워드이다 — title/slug에서 검색한다
-_FINANCE_KEYWORDS: list[str] = [
+_FINANCE_KEYWORDS: tuple[str, ...] = (
     "fed", "fomc", "rate cut", "rate hike", "interest rate",
     "recession", "tariff", "trade war", "sanctions",
     "inflation", "cpi", "gdp", "employment", "unemployment",
     "stock", "market crash", "bear market", "bull market",
     "s&p", "nasdaq", "dow", "treasury", "debt ceiling",
     "government shutdown", "default", "economy",
-]
+)
+# 키워드 전체를 하나의 대체식으로 컴파일하여 이벤트당 한 번만 스캔한다
+_FINANCE_KEYWORDS_RE = re.compile("|".join(map(re.escape, _FINANCE_KEYWORDS)))
 
 # 페이지당 요청 수이다
 _PAGE_SIZE: int = 50
 _MAX_PAGES: int = 4  # 최대 200개 이벤트 스캔
+_MAX_CONCURRENT_PAGES: int = 2  # 동시 페이지 요청 상한 (rate limit 보호)
+_MAX_EVENTS: int = 20  # 캐시에 보관할 상위 거래량 이벤트 수
 _REQUEST_TIMEOUT: float = 12.0
 _MAX_RETRIES: int = 2
 _RETRY_DELAY: float = 2.0
@@ -53,7 +60,7 @@ def _parse_market(market: dict) -> dict[str, Any]:
     outcome_prices = market.get("outcomePrices", "")
     if isinstance(outcome_prices, str):
         try:
-            outcome_prices = json.loads(outcome_prices)
+            outcome_prices = orjson.loads(outcome_prices)
         except (ValueError, TypeError):
             outcome_prices = []
 
@@ -79,8 +86,8 @@ def _parse_market(market: dict) -> dict[str, Any]:
 
 def _is_finance_related(title: str, slug: str) -> bool:
     """이벤트가 금융/경제 관련인지 판별한다."""
-    combined = (title + " " + slug).lower()
-    return any(kw in combined for kw in _FINANCE_KEYWORDS)
+    combined = f"{title} {slug}".lower()
+    return _FINANCE_KEYWORDS_RE.search(combined) is not None
 
 
 def _process_event(event: dict) -> dict[str, Any] | None:
@@ -98,10 +105,12 @@ def _process_event(event: dict) -> dict[str, Any] | None:
     parsed_markets: list[dict[str, Any]] = []
     total_volume = 0.0
     for m in markets:
+        # 질문이 없는 마켓은 가격 JSON 디코딩/변환 전에 먼저 걸러낸다
+        if not m.get("question"):
+            continue
         pm = _parse_market(m)
-        if pm["question"]:
-            parsed_markets.append(pm)
-            total_volume += pm["volume"]
+        parsed_markets.append(pm)
+        total_volume += pm["volume"]
 
     if not parsed_markets:
         return None
@@ -154,29 +163,53 @@ class PolymarketFetcher:
         return []
 
     async def _fetch_events(self) -> list[dict[str, Any]]:
-        """Gamma API events를 페이지네이션으로 조회하고 필터링한다."""
-        results: list[dict[str, Any]] = []
+        """Gamma API events를 페이지네이션으로 조회하고 필터링한다.
+
+        첫 페이지를 먼저 받아 가득 찬 경우에만 나머지 페이지를 세마포어로 동시성을
+        제한해 병렬 전송한다. 이벤트가 한 페이지에 다 들어오면 추가 요청을 보내지 않고,
+        결과는 페이지 순서대로 처리하여 순차 조회와 동일한 중단 규칙을 적용한다.
+        """
+        sem = asyncio.Semaphore(_MAX_CONCURRENT_PAGES)
 
-        for page in range(_MAX_PAGES):
-            offset = page * _PAGE_SIZE
-            page_data = await self._fetch_page(offset)
+        async def _bounded_fetch(offset: int) -> tuple[list[dict[str, Any]], int] | None:
+            async with sem:
+                page_data = await self._fetch_page(offset)
             if page_data is None:
+                return None
+            # 원본 이벤트(전체 마켓 필드 포함)는 여기서 바로 필요한 필드만 남기고 버린다
+            # 다른 페이지를 기다리는 동안 원본 페이로드를 메모리에 붙잡아 두지 않는다
+            processed = [p for p in map(_process_event, page_data) if p]
+            return processed, len(page_data)
+
+        first = await _bounded_fetch(0)
+        pages: list[tuple[list[dict[str, Any]], int] | None] = [first]
+        if first is not None and first[1] >= _PAGE_SIZE:
+            pages.extend(await asyncio.gather(
+                *(_bounded_fetch(page * _PAGE_SIZE) for page in range(1, _MAX_PAGES)),
+            ))
+
+        results: list[dict[str, Any]] = []
+        seen_slugs: set[str] = set()
+        for page in pages:
+            if page is None:
                 break  # API 실패 — 수집된 것만 반환
 
-            for event in page_data:
-                processed = _process_event(event)
-                if processed:
-                    results.append(processed)
+            processed_events, raw_count = page
+            for processed in processed_events:
+                # 페이지 경계에서 이벤트가 밀려 중복 수신되는 경우를 삽입 시점에 걸러낸다
+                slug = processed["slug"]
+                if slug:
+                    if slug in seen_slugs:
+                        continue
+                    seen_slugs.add(slug)
+                results.append(processed)
 
             # 마지막 페이지 감지
-            if len(page_data) < _PAGE_SIZE:
+            if raw_count < _PAGE_SIZE:
                 break
-            # rate limit 방지
-            await asyncio.sleep(0.3)
 
-        # 거래량 높은 순 정렬
-        results.sort(key=lambda x: x.get("total_volume", 0), reverse=True)
-        return results[:20]
+        # 거래량 상위 N개만 선택한다 — 전체 정렬 없이 O(n log k)이다
+        return heapq.nlargest(_MAX_EVENTS, results, key=lambda x: x["total_volume"])
 
     async def _fetch_page(self, offset: int) -> list[dict] | None:
         """단일 페이지를 조회한다. 실패 시 None."""
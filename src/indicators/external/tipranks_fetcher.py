@@ -8,9 +8,10 @@ API 키 불필요. Nasdaq API(주) → TipRanks(폴백) 순서로 시도한다.
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 from src.common.logger import get_logger
 from src.indicators.external._consensus_parsers import (
     determine_consensus,
@@ -224,8 +225,8 @@ class TipRanksFetcher:
         if body is None:
             return None
         try:
-            return parser(json.loads(body))
-        except (json.JSONDecodeError, TypeError) as exc:
+            return parser(orjson.loads(body))
+        except (orjson.JSONDecodeError, TypeError) as exc:
             logger.debug("JSON 파싱 실패 (%s, %s): %s", ticker, url, exc)
             return None
 
@@ -47,6 +47,10 @@ _MEDIUM_IMPACT_EVENTS: set[str] = {
     "s&p global", "richmond fed", "dallas fed", "kansas city fed",
 }
 
+# 키워드 집합을 하나의 대체(alternation) 정규식으로 합쳐 이벤트명을 한 번만 스캔한다
+_HIGH_IMPACT_RE = re.compile("|".join(map(re.escape, _HIGH_IMPACT_EVENTS)))
+_MEDIUM_IMPACT_RE = re.compile("|".join(map(re.escape, _MEDIUM_IMPACT_EVENTS)))
+
 _REQUEST_TIMEOUT: float = 15.0
 _MAX_RETRIES: int = 2
 _RETRY_DELAY: float = 3.0
@@ -83,12 +87,10 @@ _HEADERS: dict[str, str] = {
 def _classify_importance(event_name: str) -> str:
     """이벤트 중요도를 분류한다."""
     lower = event_name.lower()
-    for kw in _HIGH_IMPACT_EVENTS:
-        if kw in lower:
-            return "high"
-    for kw in _MEDIUM_IMPACT_EVENTS:
-        if kw in lower:
-            return "medium"
+    if _HIGH_IMPACT_RE.search(lower):
+        return "high"
+    if _MEDIUM_IMPACT_RE.search(lower):
+        return "medium"
     return "low"
 
 
@@ -5,6 +5,9 @@ FRED API 호출 로직을 단일 모듈로 추출한 것이다.
 """
 from __future__ import annotations
 
+import asyncio
+import json
+from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
 from src.common.logger import get_logger
@@ -26,6 +29,97 @@ FRED_SERIES: list[str] = [
 # FRED API 엔드포인트 — 다른 모듈에서도 참조하므로 공개 상수로 정의한다
 FRED_API_URL: str = "https://api.stlouisfed.org/fred/series/observations"
 _CACHE_TTL: int = 86400  # 24시간
+_HISTORY_LIMIT: int = 30  # 시리즈별 캐시에 유지하는 최근 관측값 수이다
+_REVISION_WINDOW_DAYS: int = 30  # 사후 수정을 반영하기 위해 최신 캐시일 이전으로 다시 받는 일수이다
+
+
+def _clean_observations(observations: list[dict]) -> list[dict]:
+    """FRED observations에서 유효한 숫자 값만 {date, value} 형태로 추출한다."""
+    clean: list[dict] = []
+    for o in observations:
+        raw_val = o.get("value", ".")
+        if raw_val == ".":
+            continue
+        try:
+            clean.append({"date": o.get("date", ""), "value": float(raw_val)})
+        except (ValueError, TypeError):
+            continue
+    return clean
+
+
+def _revision_window_start(cached: list[dict]) -> str | None:
+    """최신 캐시 관측일에서 _REVISION_WINDOW_DAYS일 전 날짜를 반환한다.
+
+    FRED는 최근 관측값(GDP, 고용, CPI 등)을 사후 수정하므로 최근 구간만 다시 받아
+    수정치를 반영한다. 캐시가 비었거나 날짜가 잘못되면 None이다.
+    """
+    try:
+        latest = date.fromisoformat(cached[0]["date"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+    return (latest - timedelta(days=_REVISION_WINDOW_DAYS)).isoformat()
+
+
+def _merge_observations(
+    fresh: list[dict], cached: list[dict], covered_from: str,
+) -> list[dict]:
+    """응답이 덮는 구간(covered_from 이후)은 신규 값으로 교체하고 최근 _HISTORY_LIMIT건만 유지한다.
+
+    두 리스트 모두 최신순(desc)이다. 구간 안의 캐시 값은 모두 버리므로
+    수정되었거나 결측(".")으로 바뀐 관측값이 예전 값으로 남지 않는다.
+    """
+    older = [o for o in cached if str(o.get("date", "")) < covered_from]
+    return (fresh + older)[:_HISTORY_LIMIT]
+
+
+async def _fetch_series(
+    http: AsyncHttpClient,
+    cache: CacheClient,
+    sid: str,
+    fred_key: str,
+    ttl: int,
+) -> bool:
+    """단일 FRED 시리즈를 조회하여 macro:{sid} 캐시에 병합한다. 성공 여부를 반환한다."""
+    try:
+        cache_key = f"macro:{sid}"
+        cached_raw = await cache.read(cache_key)  # type: ignore[union-attr]
+        cached = json.loads(cached_raw) if cached_raw else []
+        cached = cached if isinstance(cached, list) else []
+        params = {
+            "series_id": sid,
+            "api_key": fred_key,
+            "file_type": "json",
+            "sort_order": "desc",
+            "limit": str(_HISTORY_LIMIT),
+        }
+        # 캐시가 있으면 최근 수정 구간만 다시 받아 사후 수정된 관측값을 반영한다
+        observation_start = _revision_window_start(cached)
+        if observation_start is not None:
+            params["observation_start"] = observation_start
+        resp = await http.get(FRED_API_URL, params=params)  # type: ignore[union-attr]
+        if not resp.ok:
+            logger.warning("[FRED] %s 조회 실패: HTTP %d", sid, resp.status)
+            return False
+        observations = resp.json().get("observations", [])
+        if not observations:
+            # 응답이 덮는 구간이 없으면 기존 캐시를 그대로 둔다
+            return bool(cached)
+        # limit에 걸려 잘린 응답은 가장 오래된 반환일부터만 구간을 덮는다
+        covered_from = observation_start or ""
+        if len(observations) >= _HISTORY_LIMIT:
+            covered_from = max(covered_from, str(observations[-1].get("date", "")))
+        merged = _merge_observations(
+            _clean_observations(observations), cached, covered_from,
+        )
+        if merged and merged == cached:
+            # 내용이 그대로면 다시 쓰지 않는다 -- TTL을 연장하지 않아 예정대로 만료된 뒤 전체를 새로 받는다
+            return True
+        if merged:
+            await cache.write_json(cache_key, merged, ttl=ttl)  # type: ignore[union-attr]
+            return True
+    except Exception as exc:
+        logger.warning("[FRED] %s 개별 조회 실패: %s", sid, exc)
+    return False
 
 
 async def populate_fred_cache(
@@ -37,6 +131,11 @@ async def populate_fred_cache(
 ) -> int:
     """FRED 시리즈를 일괄 조회하여 macro:{시리즈} 캐시에 저장한다.
 
+    시리즈별 요청은 서로 독립적이므로 asyncio.gather로 동시에 전송한다.
+    캐시에 이전 관측값이 남아 있으면 최신 관측일 30일 전부터만 다시 요청하고,
+    그 구간은 응답 값으로 교체한다(수정치/결측 전환을 반영한다). 캐시가 비어 있으면
+    최근 30건 전체를 조회한다.
+
     Args:
         http: AsyncHttpClient 인스턴스이다.
         vault: SecretProvider 인스턴스이다.
@@ -51,36 +150,10 @@ async def populate_fred_cache(
         logger.info("[FRED] FRED_API_KEY 미설정 -- 건너뜀")
         return 0
 
-    count = 0
-    for sid in FRED_SERIES:
-        try:
-            params = {
-                "series_id": sid,
-                "api_key": fred_key,
-                "file_type": "json",
-                "sort_order": "desc",
-                "limit": "30",
-            }
-            resp = await http.get(FRED_API_URL, params=params)  # type: ignore[union-attr]
-            if not resp.ok:
-                logger.warning("[FRED] %s 조회 실패: HTTP %d", sid, resp.status)
-                continue
-            data = resp.json()
-            observations = data.get("observations", [])
-            clean: list[dict] = []
-            for o in observations:
-                raw_val = o.get("value", ".")
-                if raw_val == ".":
-                    continue
-                try:
-                    clean.append({"date": o.get("date", ""), "value": float(raw_val)})
-                except (ValueError, TypeError):
-                    continue
-            if clean:
-                await cache.write_json(f"macro:{sid}", clean, ttl=ttl)  # type: ignore[union-attr]
-                count += 1
-        except Exception as exc:
-            logger.warning("[FRED] %s 개별 조회 실패: %s", sid, exc)
+    results = await asyncio.gather(*(
+        _fetch_series(http, cache, sid, fred_key, ttl) for sid in FRED_SERIES
+    ))
+    count = sum(results)
 
     logger.info("[FRED] 거시지표 크롤링 완료: %d/%d 시리즈", count, len(FRED_SERIES))
     return count
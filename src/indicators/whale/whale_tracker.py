@@ -16,18 +16,29 @@ _CACHE_KEY: str = "order_flow:raw:{ticker}"
 
 def _score_blocks(trades: list[dict], threshold: float) -> tuple[float, int, float]:
     """블록 거래($200k+)를 감지하고 점수/건수/순방향을 반환한다."""
-    blocks: list[dict] = [t for t in trades if t.get("amount_usd", 0) >= threshold]
-    if not blocks:
+    # 블록 필터링과 매수/매도 금액 집계를 한 번의 순회로 처리한다
+    block_count = 0
+    buy_vol = 0.0
+    sell_vol = 0.0
+    for t in trades:
+        amount = t.get("amount_usd", 0)
+        if amount < threshold:
+            continue
+        block_count += 1
+        side = t.get("side")
+        if side == "buy":
+            buy_vol += amount
+        elif side == "sell":
+            sell_vol += amount
+    if not block_count:
         return 0.0, 0, 0.0
-    buy_vol = sum(t["amount_usd"] for t in blocks if t.get("side") == "buy")
-    sell_vol = sum(t["amount_usd"] for t in blocks if t.get("side") == "sell")
     total = buy_vol + sell_vol
     if total == 0:
-        return 0.0, len(blocks), 0.0
+        return 0.0, block_count, 0.0
     # 점수: 블록 거래 금액 비율 (최대 1.0)
     score = min(1.0, total / 1_000_000.0)
     direction = (buy_vol - sell_vol) / total
-    return score, len(blocks), direction
+    return score, block_count, direction
 
 
 def _score_icebergs(trades: list[dict], min_trades: int) -> tuple[float, int, float]:
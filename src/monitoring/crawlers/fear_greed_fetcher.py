@@ -1,10 +1,10 @@
 """Fear & Greed Index 크롤러이다. CNN 공식 API(1순위) + 스크래핑 폴백(2순위)."""
 from __future__ import annotations
 
+import asyncio
 import re
 
-import aiohttp
-
+from src.common.http_client import get_http_client
 from src.common.logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,12 +18,19 @@ _LABELS: list[tuple[int, int, str]] = [
     (75, 101, "Extreme Greed"),
 ]
 
+# 티어별 요청 타임아웃(초)이다
+_API_TIMEOUT: float = 10.0
+_SCRAPE_TIMEOUT: float = 15.0
+
 # 기본 HTTP 헤더이다
 _BROWSER_UA: str = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
 )
 
+# CNN 페이지에 내장된 "score":XX JSON 필드를 추출하는 패턴이다
+_SCORE_PATTERN = re.compile(r'"score"\s*:\s*(\d+)')
+
 
 def _score_to_label(score: int) -> str:
     """점수(0-100)를 레이블로 변환한다."""
@@ -71,25 +78,28 @@ async def _tier1_cnn_api() -> dict | None:
     """CNN Fear & Greed 공식 API에서 데이터를 가져온다."""
     url = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
     try:
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            headers = {"User-Agent": _BROWSER_UA}
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    logger.debug("CNN API HTTP %d", resp.status)
-                    return None
-                data = await resp.json()
-                fg = data.get("fear_and_greed", {})
-                raw_score = fg.get("score")
-                if raw_score is None:
-                    logger.debug("CNN API 응답에 score 필드 부재")
-                    return None
-                # 0~100 범위로 클램핑하여 비정상 값을 방지한다
-                score = max(0, min(100, int(raw_score)))
-                label = _score_to_label(score)
-                desc = fg.get("description", "") or _score_to_description(score, label)
-                logger.info("Tier 1 CNN API: score=%d, label=%s", score, label)
-                return {"score": score, "label": label, "description": desc}
+        # 공유 커넥션 풀을 재사용하여 매 호출 TLS 핸드셰이크를 피한다
+        # 5xx 백오프 재시도는 끄고 실패 시 바로 다음 티어로 넘어간다
+        headers = {"User-Agent": _BROWSER_UA}
+        resp = await asyncio.wait_for(
+            get_http_client().get(url, headers=headers, max_retries=1),
+            timeout=_API_TIMEOUT,
+        )
+        if resp.status != 200:
+            logger.debug("CNN API HTTP %d", resp.status)
+            return None
+        data = resp.json()
+        fg = data.get("fear_and_greed", {})
+        raw_score = fg.get("score")
+        if raw_score is None:
+            logger.debug("CNN API 응답에 score 필드 부재")
+            return None
+        # 0~100 범위로 클램핑하여 비정상 값을 방지한다
+        score = max(0, min(100, int(raw_score)))
+        label = _score_to_label(score)
+        desc = fg.get("description", "") or _score_to_description(score, label)
+        logger.info("Tier 1 CNN API: score=%d, label=%s", score, label)
+        return {"score": score, "label": label, "description": desc}
     except Exception as exc:
         logger.debug("Tier 1 CNN API 실패: %s", exc)
         return None
@@ -99,25 +109,26 @@ async def _tier2_cnn_scrape() -> dict | None:
     """CNN Fear & Greed 페이지에서 스크래핑한다."""
     url = "https://edition.cnn.com/markets/fear-and-greed"
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = {"User-Agent": _BROWSER_UA}
-            timeout = aiohttp.ClientTimeout(total=15)
-            async with session.get(url, headers=headers, timeout=timeout) as resp:
-                if resp.status != 200:
-                    logger.debug("CNN scrape HTTP %d", resp.status)
-                    return None
-                text = await resp.text()
-                # CNN 페이지에서 "score":XX 형태의 JSON 블록을 파싱한다
-                match = re.search(r'"score"\s*:\s*(\d+)', text)
-                if match:
-                    # 0~100 범위로 클램핑하여 비정상 값을 방지한다
-                    score = max(0, min(100, int(match.group(1))))
-                    label = _score_to_label(score)
-                    desc = _score_to_description(score, label)
-                    logger.info("Tier 2 CNN scrape: score=%d, label=%s", score, label)
-                    return {"score": score, "label": label, "description": desc}
-                logger.debug("CNN scrape 페이지에서 score 패턴을 찾지 못했다")
-                return None
+        headers = {"User-Agent": _BROWSER_UA}
+        resp = await asyncio.wait_for(
+            get_http_client().get(url, headers=headers, max_retries=1),
+            timeout=_SCRAPE_TIMEOUT,
+        )
+        if resp.status != 200:
+            logger.debug("CNN scrape HTTP %d", resp.status)
+            return None
+        text = resp.body
+        # CNN 페이지에서 "score":XX 형태의 JSON 블록을 파싱한다
+        match = _SCORE_PATTERN.search(text)
+        if match:
+            # 0~100 범위로 클램핑하여 비정상 값을 방지한다
+            score = max(0, min(100, int(match.group(1))))
+            label = _score_to_label(score)
+            desc = _score_to_description(score, label)
+            logger.info("Tier 2 CNN scrape: score=%d, label=%s", score, label)
+            return {"score": score, "label": label, "description": desc}
+        logger.debug("CNN scrape 페이지에서 score 패턴을 찾지 못했다")
+        return None
     except Exception as exc:
         logger.debug("Tier 2 CNN scrape 실패: %s", exc)
         return None
@@ -9,6 +9,7 @@ import re
 
 import aiohttp
 
+from src.common.http_client import get_http_client
 from src.common.logger import get_logger
 
 _logger = get_logger(__name__)
@@ -19,8 +20,23 @@ _GOOGLE_FINANCE_URL = "https://www.google.com/finance/quote/USD-KRW"
 # 구글 검색 환율 URL이다
 _GOOGLE_SEARCH_URL = "https://www.google.com/search?q=1+USD+to+KRW"
 
+# 요청 헤더이다 -- 호출마다 dict를 새로 만들지 않도록 모듈 상수로 둔다
+_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+_FINANCE_HEADERS: dict[str, str] = {
+    "User-Agent": _USER_AGENT,
+    "Accept-Language": "en-US,en;q=0.9",
+}
+_SEARCH_HEADERS: dict[str, str] = {
+    "User-Agent": _USER_AGENT,
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
 # 요청 타임아웃(초)이다
 _REQUEST_TIMEOUT: int = 10
+_TIMEOUT = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
 
 # 구글 Finance 페이지에서 환율을 추출하는 정규식 패턴이다
 # data-last-price 속성에서 숫자를 추출한다
@@ -38,6 +54,9 @@ _SEARCH_RATE_PATTERN = re.compile(
     r'([\d,]+\.?\d*)\s*(?:대한민국\s*원|South\s*Korean\s*Won|KRW)',
 )
 
+# 대체 패턴: 구글 검색 결과의 data-value 속성이다
+_DATA_VALUE_PATTERN = re.compile(r'data-value="([\d.]+)"')
+
 
 async def fetch_google_usd_krw() -> float | None:
     """구글에서 USD/KRW 환율을 크롤링한다.
@@ -64,18 +83,12 @@ async def fetch_google_usd_krw() -> float | None:
 async def _try_google_finance() -> float | None:
     """구글 Finance 페이지에서 환율을 파싱한다."""
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-        timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(_GOOGLE_FINANCE_URL, headers=headers) as resp:
-                if resp.status != 200:
-                    _logger.debug("구글 Finance HTTP %d", resp.status)
-                    return None
-                html = await resp.text()
+        session = await get_http_client().session()
+        async with session.get(_GOOGLE_FINANCE_URL, headers=_FINANCE_HEADERS, timeout=_TIMEOUT) as resp:
+            if resp.status != 200:
+                _logger.debug("구글 Finance HTTP %d", resp.status)
+                return None
+            html = await resp.text()
 
         # data-last-price 속성에서 추출을 시도한다
         match = _FINANCE_RATE_PATTERN.search(html)
@@ -104,18 +117,12 @@ async def _try_google_finance() -> float | None:
 async def _try_google_search() -> float | None:
     """구글 검색 결과에서 환율을 파싱한다."""
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-        }
-        timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(_GOOGLE_SEARCH_URL, headers=headers) as resp:
-                if resp.status != 200:
-                    _logger.debug("구글 검색 HTTP %d", resp.status)
-                    return None
-                html = await resp.text()
+        session = await get_http_client().session()
+        async with session.get(_GOOGLE_SEARCH_URL, headers=_SEARCH_HEADERS, timeout=_TIMEOUT) as resp:
+            if resp.status != 200:
+                _logger.debug("구글 검색 HTTP %d", resp.status)
+                return None
+            html = await resp.text()
 
         match = _SEARCH_RATE_PATTERN.search(html)
         if match:
@@ -126,7 +133,7 @@ async def _try_google_search() -> float | None:
                 return rate
 
         # data-value 패턴으로 시도한다
-        data_value_match = re.search(r'data-value="([\d.]+)"', html)
+        data_value_match = _DATA_VALUE_PATTERN.search(html)
         if data_value_match:
             rate = float(data_value_match.group(1))
             if 900 < rate < 2000:
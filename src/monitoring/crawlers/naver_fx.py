@@ -5,10 +5,12 @@ FxScheduler의 2차 폴백 소스로 사용된다.
 """
 from __future__ import annotations
 
+import json
 import re
 
 import aiohttp
 
+from src.common.http_client import get_http_client
 from src.common.logger import get_logger
 
 _logger = get_logger(__name__)
@@ -16,13 +18,31 @@ _logger = get_logger(__name__)
 # 네이버 금융 환율 상세 페이지 URL이다
 _NAVER_FX_URL = "https://finance.naver.com/marketindex/exchangeDetail.naver?marketindexCd=FX_USDKRW"
 
+# 네이버 증권 모바일 API URL이다
+_NAVER_MOBILE_API_URL = (
+    "https://m.stock.naver.com/front-api/marketIndex/productDetail"
+    "?category=exchange&reutersCode=FX_USDKRW"
+)
+
+# 요청 헤더이다 -- 호출마다 dict를 새로 만들지 않도록 모듈 상수로 둔다
+_WEB_HEADERS: dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+}
+_MOBILE_HEADERS: dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) "
+    "AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
+}
+
 # 요청 타임아웃(초)이다
 _REQUEST_TIMEOUT: int = 10
+_TIMEOUT = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
 
 # 매매기준율을 추출하는 정규식 패턴이다
 # 네이버 금융 페이지에서 "현재가" 영역의 숫자를 파싱한다
+# 패턴이 ASCII만 포함하므로 euc-kr 본문을 디코딩하지 않고 바이트에서 바로 검색한다
 _RATE_PATTERN = re.compile(
-    r'class="no_today"[^>]*>.*?<em[^>]*>\s*([\d,]+\.?\d*)',
+    rb'class="no_today"[^>]*>.*?<em[^>]*>\s*([\d,]+\.?\d*)',
     re.DOTALL,
 )
 
@@ -55,21 +75,16 @@ async def fetch_naver_usd_krw() -> float | None:
 async def _try_naver_web() -> float | None:
     """네이버 금융 PC 웹 페이지에서 환율을 파싱한다."""
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        }
-        timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(_NAVER_FX_URL, headers=headers) as resp:
-                if resp.status != 200:
-                    _logger.debug("네이버 금융 페이지 HTTP %d", resp.status)
-                    return None
-                html = await resp.text()
-
-        match = _RATE_PATTERN.search(html)
+        session = await get_http_client().session()
+        async with session.get(_NAVER_FX_URL, headers=_WEB_HEADERS, timeout=_TIMEOUT) as resp:
+            if resp.status != 200:
+                _logger.debug("네이버 금융 페이지 HTTP %d", resp.status)
+                return None
+            raw = await resp.read()
+
+        match = _RATE_PATTERN.search(raw)
         if match:
-            rate_str = match.group(1).replace(",", "")
+            rate_str = match.group(1).replace(b",", b"")
             rate = float(rate_str)
             if 900 < rate < 2000:  # 합리적인 USD/KRW 범위 검증
                 _logger.info("네이버 웹 환율 크롤링 성공: %.2f", rate)
@@ -85,22 +100,13 @@ async def _try_naver_web() -> float | None:
 
 async def _try_naver_mobile_api() -> float | None:
     """네이버 증권 모바일 API에서 환율을 조회한다."""
-    url = (
-        "https://m.stock.naver.com/front-api/marketIndex/productDetail"
-        "?category=exchange&reutersCode=FX_USDKRW"
-    )
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) "
-            "AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
-        }
-        timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    _logger.debug("네이버 모바일 API HTTP %d", resp.status)
-                    return None
-                text = await resp.text()
+        session = await get_http_client().session()
+        async with session.get(_NAVER_MOBILE_API_URL, headers=_MOBILE_HEADERS, timeout=_TIMEOUT) as resp:
+            if resp.status != 200:
+                _logger.debug("네이버 모바일 API HTTP %d", resp.status)
+                return None
+            text = await resp.text()
 
         match = _ALT_RATE_PATTERN.search(text)
         if match:
@@ -112,7 +118,6 @@ async def _try_naver_mobile_api() -> float | None:
 
         # JSON 파싱 시도
         try:
-            import json
             data = json.loads(text)
             # 중첩 구조에서 closePrice를 탐색한다
             result = data.get("result", data)
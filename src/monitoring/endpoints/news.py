@@ -282,14 +282,7 @@ async def get_news_summary(date: str | None = None, _auth: str = Depends(verify_
         async with db.get_session() as session:
             # 하루 기사 수가 극단적으로 많을 수 있으므로 1000건으로 제한한다
             _MAX_SUMMARY_ARTICLES = 1000
-            if date:
-                stmt = (
-                    select(Article)
-                    .where(func.date(Article.published_at) == date)
-                    .order_by(Article.published_at.desc())
-                    .limit(_MAX_SUMMARY_ARTICLES)
-                )
-            else:
+            if not date:
                 # 최신 날짜를 먼저 찾는다
                 latest_stmt = (
                     select(func.date(Article.published_at).label("dt"))
@@ -302,15 +295,19 @@ async def get_news_summary(date: str | None = None, _auth: str = Depends(verify_
                 if latest_row is None:
                     return NewsSummaryResponse(message="요약 데이터가 없다")
                 date = str(latest_row)
-                stmt = (
-                    select(Article)
-                    .where(func.date(Article.published_at) == date)
-                    .order_by(Article.published_at.desc())
-                    .limit(_MAX_SUMMARY_ARTICLES)
-                )
 
+            # 집계에는 본문이 필요 없으므로 content를 제외한 좁은 컬럼만 읽는다
+            stmt = (
+                select(
+                    Article.id, Article.category, Article.source,
+                    Article.direction, Article.impact_score,
+                )
+                .where(func.date(Article.published_at) == date)
+                .order_by(Article.published_at.desc())
+                .limit(_MAX_SUMMARY_ARTICLES)
+            )
             result = await session.execute(stmt)
-            rows = result.scalars().all()
+            rows = result.all()
 
             if not rows:
                 return NewsSummaryResponse(message="요약 데이터가 없다")
@@ -319,10 +316,17 @@ async def get_news_summary(date: str | None = None, _auth: str = Depends(verify_
             by_category = dict(Counter(r.category or "unknown" for r in rows))
             by_source = dict(Counter(r.source or "unknown" for r in rows))
             sentiment_dist = dict(Counter(r.direction or "neutral" for r in rows))
-            high_impact = [
-                _article_to_dict(r) for r in rows
-                if (r.impact_score or 0) >= 0.7
-            ][:10]
+            # 본문을 포함한 전체 행은 고영향 상위 10건만 다시 조회한다
+            high_ids = [r.id for r in rows if (r.impact_score or 0) >= 0.7][:10]
+            high_impact: list[dict[str, Any]] = []
+            if high_ids:
+                full_result = await session.execute(
+                    select(Article).where(Article.id.in_(high_ids)),
+                )
+                by_id = {a.id: a for a in full_result.scalars()}
+                high_impact = [
+                    _article_to_dict(by_id[i]) for i in high_ids if i in by_id
+                ]
 
             return NewsSummaryResponse(
                 date=date,
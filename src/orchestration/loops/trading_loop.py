@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import time
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -529,15 +530,13 @@ async def _persist_trade_to_db(
     tax_writer, trade_reasoning 엔드포인트가 DB에서 거래 이력을 조회한다.
     reason 필드에 PnL을 JSON으로 포함하여 세금 계산 시 추출할 수 있게 한다.
     """
-    import json as _json
-
     from src.db.models import Trade
 
     # reason에 PnL 정보를 JSON으로 포함한다 (tax_writer._extract_pnl_from_trade가 파싱)
     pnl_value = None
     if pnl_pct is not None and price > 0 and abs(100.0 + pnl_pct) > 1e-9:
         pnl_value = round(price * pnl_pct / (100.0 + pnl_pct) * quantity, 2)
-    reason_json = _json.dumps(
+    reason_json = json.dumps(
         {"text": reason, "pnl": pnl_value, "pnl_pct": pnl_pct},
         ensure_ascii=False,
     )
@@ -774,8 +773,7 @@ async def _run_beast_entry(
             severity="error",
         )
         try:
-            import time as _time
-            await cache.write("beast:last_failure_time", str(_time.time()), ttl=_TTL_1DAY)
+            await cache.write("beast:last_failure_time", str(time.time()), ttl=_TTL_1DAY)
         except Exception as exc2:
             logger.debug("beast:last_failure_time 캐시 기록 실패 (무시): %s", exc2)
     except Exception as exc:
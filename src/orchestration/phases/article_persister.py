@@ -4,7 +4,7 @@ from __future__ import annotations
 import hashlib
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 
 from src.common.database_gateway import SessionFactory
 from src.common.logger import get_logger
@@ -20,11 +20,60 @@ async def persist_articles(
     """ClassifiedNews dict 리스트를 articles 테이블에 저장한다.
 
     URL 기준 UPSERT (중복 URL은 건너뜀). (저장 건수, 실패 건수) 튜플을 반환한다.
-    기사별 독립 세션을 사용하여 개별 실패가 다른 기사에 영향을 주지 않는다.
+    한 세션에서 기존 URL을 IN 조회 1회로 걸러낸 뒤 다중 행 INSERT로 일괄 저장한다.
+    일괄 저장이 실패하면 기사별 독립 세션으로 폴백하여 개별 실패를 격리한다.
     """
     if not classified:
         return 0, 0
 
+    # 배치 내 중복 URL은 첫 기사만 남긴다 (순차 저장 시 뒤 기사가 건너뛰어지던 동작과 같다)
+    rows: dict[str, dict] = {}
+    for item in classified:
+        url = item.get("url", "")
+        if url and url not in rows:
+            rows[url] = _article_row(item, url)
+    if not rows:
+        return 0, 0
+
+    try:
+        async with db.get_session() as session:
+            existing = await session.execute(
+                select(Article.url).where(Article.url.in_(rows.keys())),
+            )
+            for url in existing.scalars():
+                rows.pop(url, None)
+            if rows:
+                await session.execute(insert(Article), list(rows.values()))
+    except Exception as exc:
+        logger.warning("[Step 3.5] 기사 일괄 저장 실패 -- 기사별 저장으로 폴백: %s", exc)
+        return await _persist_one_by_one(db, classified)
+
+    saved = len(rows)
+    logger.info("[Step 3.5] DB 저장 완료: 성공=%d, 실패=0, 전체=%d건", saved, len(classified))
+    return saved, 0
+
+
+def _article_row(item: dict, url: str) -> dict:
+    """ClassifiedNews dict를 articles INSERT 파라미터로 변환한다."""
+    content = item.get("content", "")
+    return {
+        "title": item.get("title", ""),
+        "content": content,
+        "url": url,
+        "source": item.get("source", ""),
+        "published_at": item.get("published_at"),
+        "content_hash": hashlib.sha256(content.encode()).hexdigest(),
+        "impact_score": item.get("impact_score", 0.0),
+        "direction": item.get("direction", "neutral"),
+        "category": item.get("category", ""),
+    }
+
+
+async def _persist_one_by_one(
+    db: SessionFactory,
+    classified: list[dict],
+) -> tuple[int, int]:
+    """기사별 독립 세션으로 저장한다. 개별 실패가 다른 기사에 영향을 주지 않는다."""
     saved = 0
     failed = 0
     for item in classified:
@@ -39,22 +88,7 @@ async def persist_articles(
                 )
                 if exists.scalar_one_or_none() is not None:
                     continue
-
-                content = item.get("content", "")
-                content_hash = hashlib.sha256(content.encode()).hexdigest()
-
-                article = Article(
-                    title=item.get("title", ""),
-                    content=content,
-                    url=url,
-                    source=item.get("source", ""),
-                    published_at=item.get("published_at"),
-                    content_hash=content_hash,
-                    impact_score=item.get("impact_score", 0.0),
-                    direction=item.get("direction", "neutral"),
-                    category=item.get("category", ""),
-                )
-                session.add(article)
+                session.add(Article(**_article_row(item, url)))
             saved += 1
         except Exception as exc:
             failed += 1
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import json
 import math
+import re
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
@@ -28,6 +29,9 @@ _TOTAL_STEPS: int = 28
 # UTC 기준이면 07:00 KST(=22:00 UTC 전일)에 전날 날짜가 선택되는 버그가 발생한다.
 _KST = ZoneInfo("Asia/Seoul")
 
+# "→ param_name old_val → new_val" 형식의 파라미터 변경 설명 패턴이다
+_PARAM_CHANGE_PATTERN = re.compile(r"→\s+(\S+)\s+([\d.]+)\s+→\s+([\d.]+)")
+
 
 class EODReport(BaseModel):
     """EOD 결과 보고서이다."""
@@ -604,10 +608,7 @@ def _parse_param_change(desc: str) -> tuple[str, str, str]:
     형식 예시: "승률 45.0% < 50% → min_confidence 0.500 → 0.525"
     파싱 실패 시 기본값(unknown, -, -)을 반환한다.
     """
-    import re
-
-    # "→ param_name old_val → new_val" 패턴을 찾는다
-    match = re.search(r"→\s+(\S+)\s+([\d.]+)\s+→\s+([\d.]+)", desc)
+    match = _PARAM_CHANGE_PATTERN.search(desc)
     if match:
         return match.group(1), match.group(2), match.group(3)
     return "unknown", "-", "-"
@@ -8,6 +8,8 @@ from __future__ import annotations
 import math
 from datetime import datetime, timezone
 
+from sqlalchemy import insert
+
 from src.common.database_gateway import SessionFactory
 from src.common.logger import get_logger
 from src.db.models import IndicatorHistory
@@ -65,18 +67,23 @@ async def persist_indicator_bundle(
         return 0
 
     saved = 0
+    # 같은 스냅샷의 지표는 동일한 기록 시각을 공유하도록 시계를 한 번만 읽는다
+    recorded_at = datetime.now(tz=timezone.utc)
+    # 고정 형태의 숫자 행이므로 ORM 객체 없이 단일 executemany INSERT로 기록한다
+    rows = [
+        {
+            "ticker": ticker,
+            "indicator_name": name,
+            "value": value,
+            "recorded_at": recorded_at,
+            "metadata_": meta,
+        }
+        for name, value, meta in entries
+    ]
     try:
         async with db.get_session() as session:
-            for name, value, meta in entries:
-                record = IndicatorHistory(
-                    ticker=ticker,
-                    indicator_name=name,
-                    value=value,
-                    recorded_at=datetime.now(tz=timezone.utc),
-                    metadata_=meta,
-                )
-                session.add(record)
-            saved = len(entries)
+            await session.execute(insert(IndicatorHistory), rows)
+            saved = len(rows)
         logger.debug("지표 DB 저장: %s %d건", ticker, saved)
     except Exception as exc:
         logger.warning("지표 DB 저장 실패 (%s): %s", ticker, exc)
@@ -9,6 +9,7 @@ Haiku 호출 실패 시 동일 구조의 간단 포맷으로 폴백한다.
 from __future__ import annotations
 
 import json
+import re
 from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Any
@@ -24,6 +25,10 @@ logger = get_logger(__name__)
 _HIGH_IMPACT_THRESHOLD: float = HIGH_IMPACT_THRESHOLD
 _KST = ZoneInfo("Asia/Seoul")
 
+# Telegram이 지원하는 태그만 허용한다: b, i, u, s, code, pre, a
+_ALLOWED_TAGS: frozenset[str] = frozenset({"b", "i", "u", "s", "code", "pre", "a"})
+_ANY_TAG_RE = re.compile(r"<(/?\w[^>]*)>")
+
 _DIRECTION_EMOJI: dict[str, str] = {
     "bullish": "📈",
     "bearish": "📉",
@@ -77,6 +82,12 @@ _STATUS_EMOJI: dict[str, str] = {
 # ──────────────────── 유틸리티 ────────────────────
 
 
+def _sanitize_tag(m: re.Match) -> str:
+    """Telegram 미지원 HTML 태그를 제거하고 허용 태그는 그대로 둔다."""
+    tag_name = m.group(1).split()[0].lower().strip("/")
+    return m.group(0) if tag_name in _ALLOWED_TAGS else ""
+
+
 def _parse_dt(raw: datetime | str | None) -> datetime | None:
     """published_at 필드를 datetime으로 파싱한다."""
     if raw is None:
@@ -262,13 +273,7 @@ async def format_news_for_telegram(
         if len(formatted) > 4000:
             formatted = formatted[:3990] + "\n..."
         # Haiku가 지원되지 않는 HTML 태그를 생성할 수 있으므로 안전 변환한다
-        import re
-        # Telegram이 지원하는 태그만 허용한다: b, i, u, s, code, pre, a
-        _ALLOWED = {"b", "i", "u", "s", "code", "pre", "a"}
-        def _sanitize_tag(m: re.Match) -> str:
-            tag_name = m.group(1).split()[0].lower().strip("/")
-            return m.group(0) if tag_name in _ALLOWED else ""
-        formatted = re.sub(r"<(/?\w[^>]*)>", _sanitize_tag, formatted)
+        formatted = _ANY_TAG_RE.sub(_sanitize_tag, formatted)
         logger.info("[Haiku] 텔레그램 메시지 포맷팅 완료 (%d자)", len(formatted))
         return formatted
     except Exception as exc:
@@ -6,7 +6,10 @@ TGA(재무부일반계정), WALCL(연준자산), RRPONTSYD(역레포) 데이터
 
 from __future__ import annotations
 
+import asyncio
+
 from src.common.cache_gateway import CacheClient
+from src.common.http_client import HttpClientError, get_http_client
 from src.common.logger import get_logger
 from src.indicators.misc.fred_fetcher import FRED_API_URL
 from src.risk.models import LiquidityBias
@@ -33,6 +36,9 @@ _MULTIPLIERS: dict[str, float] = {
 _CACHE_KEY: str = "macro:net_liquidity"
 _CACHE_TTL: int = 3600  # 1시간
 
+# -- FRED 요청 타임아웃(초) --
+_REQUEST_TIMEOUT: float = 10.0
+
 
 class NetLiquidityTracker:
     """FRED 기반 순유동성 추적기이다.
@@ -95,10 +101,11 @@ class NetLiquidityTracker:
         _logger.info("NetLiquidityTracker 리셋 완료")
 
     async def _fetch_latest(self, series_id: str) -> float:
-        """FRED API에서 최신 관측값을 가져온다."""
-        import httpx
+        """FRED API에서 최신 관측값을 가져온다.
 
-        url = FRED_API_URL
+        공유 HTTP 클라이언트의 keep-alive 풀을 사용하여
+        시리즈마다 FRED TLS 연결을 새로 맺지 않는다.
+        """
         params = {
             "series_id": series_id,
             "api_key": self._api_key,
@@ -107,9 +114,13 @@ class NetLiquidityTracker:
             "limit": "1",
         }
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(url, params=params)
-            resp.raise_for_status()
+        # 5xx 백오프 재시도(최대 7초)가 10초 타임아웃을 잠식하지 않도록 한 번만 시도한다
+        resp = await asyncio.wait_for(
+            get_http_client().get(FRED_API_URL, params=params, max_retries=1),
+            timeout=_REQUEST_TIMEOUT,
+        )
+        if not resp.ok:
+            raise HttpClientError(f"FRED {series_id}: HTTP {resp.status}")
 
         data = resp.json()
         observations = data.get("observations", [])
@@ -0,0 +1,65 @@
+"""공용 pytest 픽스처이다.
+
+DB가 필요한 테스트는 tmp_path 아래 임시 SQLite 파일로 실제 SessionFactory를 구성한다.
+외부 HTTP는 요청을 기록하고 미리 넣어 둔 응답을 돌려주는 FakeHttpClient로 대체한다.
+"""
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.common.cache_gateway import CacheClient
+from src.common.database_gateway import SessionFactory
+from src.common.http_client import HttpResponse
+
+
+class FakeHttpClient:
+    """get 호출 인자를 기록하고 queue()로 넣어 둔 응답을 순서대로 반환한다."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self._responses: list[HttpResponse] = []
+
+    def queue(
+        self, status: int = 200, body: str = "", headers: dict[str, str] | None = None,
+    ) -> None:
+        """다음 get 호출에 돌려줄 응답을 추가한다."""
+        self._responses.append(
+            HttpResponse(status=status, body=body, headers=headers or {}),
+        )
+
+    async def get(
+        self, url: str, headers: dict | None = None, params: dict | None = None,
+        max_retries: int = 3,
+    ) -> HttpResponse:
+        """호출을 기록하고 대기 중인 첫 응답을 반환한다."""
+        self.calls.append({
+            "url": url, "headers": headers, "params": params, "max_retries": max_retries,
+        })
+        return self._responses.pop(0)
+
+
+@pytest.fixture
+async def db(tmp_path: Path) -> AsyncGenerator[SessionFactory, None]:
+    """임시 파일 DB에 전체 스키마를 생성한 SessionFactory를 제공한다."""
+    factory = SessionFactory(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    await factory.create_tables()
+    yield factory
+    await factory.close()
+
+
+@pytest.fixture
+def http_client() -> FakeHttpClient:
+    """응답 대기열이 빈 FakeHttpClient를 제공한다."""
+    return FakeHttpClient()
+
+
+@pytest.fixture
+async def cache() -> AsyncGenerator[CacheClient, None]:
+    """테스트마다 새 인메모리 CacheClient를 제공한다."""
+    client = CacheClient()
+    yield client
+    await client.aclose()
@@ -0,0 +1,92 @@
+"""ApiCrawler Stocktwits since 커서 테스트이다."""
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from src.common.secret_vault import SecretProvider
+from src.crawlers.models import SourceConfig
+from src.crawlers.sources.api_crawler import ApiCrawler
+
+if TYPE_CHECKING:
+    from conftest import FakeHttpClient
+
+_STOCKTWITS = SourceConfig(
+    name="stocktwits",
+    url="https://api.stocktwits.example/streams/trending.json",
+    source_type="api",
+)
+_FEARGREED = SourceConfig(
+    name="feargreed", url="https://cnn.example/fng", source_type="api",
+)
+
+
+def _messages(*ids: int) -> str:
+    """Stocktwits 메시지 스트림 응답 본문을 만든다."""
+    return json.dumps({"messages": [
+        {"id": i, "body": f"msg {i}", "created_at": "2026-03-02T14:00:00Z"}
+        for i in ids
+    ]})
+
+
+def _crawler(http_client: FakeHttpClient) -> ApiCrawler:
+    """토큰이 설정된 ApiCrawler를 만든다."""
+    vault = SecretProvider({"STOCKTWITS_ACCESS_TOKEN": "tok"})
+    return ApiCrawler(http_client, vault)  # type: ignore[arg-type]
+
+
+async def test_since_cursor_follows_the_highest_message_id(
+    http_client: FakeHttpClient,
+) -> None:
+    crawler = _crawler(http_client)
+    http_client.queue(body=_messages(101, 105, 103))
+    http_client.queue(body=_messages(106))
+
+    first = await crawler.crawl(_STOCKTWITS)
+    await crawler.crawl(_STOCKTWITS)
+
+    assert len(first) == 3
+    assert http_client.calls[0]["params"] == {"access_token": "tok"}
+    assert http_client.calls[1]["params"] == {"access_token": "tok", "since": "105"}
+
+
+async def test_empty_stream_keeps_the_cursor(http_client: FakeHttpClient) -> None:
+    crawler = _crawler(http_client)
+    http_client.queue(body=_messages(105))
+    http_client.queue(body=_messages())
+    http_client.queue(body=_messages())
+
+    for _ in range(3):
+        await crawler.crawl(_STOCKTWITS)
+
+    assert http_client.calls[2]["params"]["since"] == "105"
+
+
+async def test_error_response_resets_the_cursor(http_client: FakeHttpClient) -> None:
+    crawler = _crawler(http_client)
+    http_client.queue(body=_messages(105))
+    http_client.queue(status=400)
+    http_client.queue(body=_messages(200))
+
+    await crawler.crawl(_STOCKTWITS)
+    assert await crawler.crawl(_STOCKTWITS) == []
+    await crawler.crawl(_STOCKTWITS)
+
+    # 무효 커서로 계속 실패하지 않도록 오류 후에는 전체 스트림부터 다시 받는다
+    assert "since" not in http_client.calls[2]["params"]
+
+
+async def test_cursor_is_limited_to_supported_sources(
+    http_client: FakeHttpClient,
+) -> None:
+    crawler = _crawler(http_client)
+    body = json.dumps({
+        "fear_and_greed": {"score": 40.0, "rating": "fear"}, "messages": [{"id": 9}],
+    })
+    http_client.queue(body=body)
+    http_client.queue(body=body)
+
+    await crawler.crawl(_FEARGREED)
+    await crawler.crawl(_FEARGREED)
+
+    assert http_client.calls[1]["params"] == {}
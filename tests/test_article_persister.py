@@ -0,0 +1,95 @@
+"""article_persister 일괄 저장/폴백 경로 테스트이다."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select
+
+from src.common.database_gateway import SessionFactory
+from src.db.models import Article
+from src.orchestration.phases.article_persister import persist_articles
+
+_PUBLISHED_AT = datetime(2026, 1, 2, 3, 4, tzinfo=timezone.utc)
+
+
+def _item(url: str, title: str = "title", **overrides: object) -> dict:
+    """분류 완료 기사 dict를 만든다."""
+    item: dict = {
+        "title": title,
+        "content": f"body of {url}",
+        "url": url,
+        "source": "reuters",
+        "published_at": _PUBLISHED_AT,
+        "impact_score": 0.8,
+        "direction": "bullish",
+        "category": "macro",
+    }
+    item.update(overrides)
+    return item
+
+
+async def _titles_by_url(db: SessionFactory) -> dict[str, str]:
+    """저장된 기사의 url -> title 매핑을 반환한다."""
+    async with db.get_session() as session:
+        result = await session.execute(select(Article.url, Article.title))
+        return dict(result.all())
+
+
+async def test_bulk_insert_saves_every_new_article(db: SessionFactory) -> None:
+    saved, failed = await persist_articles(
+        db, [_item("https://a.example/1"), _item("https://a.example/2")],
+    )
+
+    assert (saved, failed) == (2, 0)
+    async with db.get_session() as session:
+        row = (await session.execute(
+            select(Article).where(Article.url == "https://a.example/1"),
+        )).scalar_one()
+    assert row.source == "reuters"
+    assert row.impact_score == 0.8
+    assert row.direction == "bullish"
+    assert row.content_hash is not None
+    assert row.id  # Python-side UUID 기본값이 executemany에도 적용된다
+
+
+async def test_bulk_insert_skips_existing_and_in_batch_duplicate_urls(
+    db: SessionFactory,
+) -> None:
+    await persist_articles(db, [_item("https://a.example/old", title="original")])
+
+    saved, failed = await persist_articles(db, [
+        _item("https://a.example/old", title="replayed"),
+        _item("https://a.example/new", title="first"),
+        _item("https://a.example/new", title="second"),
+        _item("", title="no url"),
+    ])
+
+    assert (saved, failed) == (1, 0)
+    assert await _titles_by_url(db) == {
+        "https://a.example/old": "original",
+        "https://a.example/new": "first",
+    }
+
+
+async def test_empty_batch_writes_nothing(db: SessionFactory) -> None:
+    assert await persist_articles(db, []) == (0, 0)
+    assert await persist_articles(db, [_item("")]) == (0, 0)
+
+
+async def test_bulk_failure_falls_back_to_per_article_sessions(
+    db: SessionFactory,
+) -> None:
+    # 문자열 published_at은 SQLite DateTime 바인딩에서 거부되어 일괄 INSERT 전체가 실패한다
+    saved, failed = await persist_articles(db, [
+        _item("https://a.example/1"),
+        _item("https://a.example/bad", published_at="not-a-datetime"),
+        _item("https://a.example/2"),
+    ])
+
+    assert (saved, failed) == (2, 1)
+    assert set(await _titles_by_url(db)) == {
+        "https://a.example/1", "https://a.example/2",
+    }
+    async with db.get_session() as session:
+        count = (await session.execute(select(func.count(Article.id)))).scalar_one()
+    assert count == 2
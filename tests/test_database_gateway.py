@@ -0,0 +1,66 @@
+"""DatabaseGateway 스키마 동기화(누락 인덱스 생성/폐기 인덱스 삭제) 테스트이다."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from sqlalchemy import text
+
+from src.common.database_gateway import _RETIRED_INDEXES, SessionFactory
+
+# 이전 스키마가 만들던 인덱스 DDL이다 (alembic 0004_sqlite_initial 기준)
+_LEGACY_INDEX_DDL: dict[str, str] = {
+    "ix_articles_content_hash": "CREATE INDEX ix_articles_content_hash ON articles (content_hash)",
+    "ix_universe_config_enabled": "CREATE INDEX ix_universe_config_enabled ON universe_config (enabled)",
+    "ix_indicator_history_ticker": "CREATE INDEX ix_indicator_history_ticker ON indicator_history (ticker)",
+    "ix_trades_ticker": "CREATE INDEX ix_trades_ticker ON trades (ticker)",
+    "ix_trades_side": "CREATE INDEX ix_trades_side ON trades (side)",
+    "ix_feedback_reports_report_type": "CREATE INDEX ix_feedback_reports_report_type ON feedback_reports (report_type)",
+    "ix_feedback_reports_report_date": "CREATE INDEX ix_feedback_reports_report_date ON feedback_reports (report_date)",
+}
+
+
+async def _index_names(factory: SessionFactory) -> set[str]:
+    """sqlite_master의 인덱스 이름 집합을 반환한다."""
+    async with factory.get_session() as session:
+        result = await session.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index'"),
+        )
+        return {row[0] for row in result}
+
+
+def test_every_retired_index_has_legacy_ddl() -> None:
+    assert set(_RETIRED_INDEXES) == set(_LEGACY_INDEX_DDL)
+
+
+async def test_create_tables_drops_retired_indexes_from_old_schema(
+    tmp_path: Path,
+) -> None:
+    factory = SessionFactory(f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}")
+    try:
+        await factory.create_tables()
+        # 이전 버전으로 만든 DB처럼 폐기된 인덱스를 되살린다
+        async with factory.get_session() as session:
+            for ddl in _LEGACY_INDEX_DDL.values():
+                await session.execute(text(ddl))
+        assert set(_RETIRED_INDEXES) <= await _index_names(factory)
+
+        await factory.create_tables()
+
+        names = await _index_names(factory)
+        assert names.isdisjoint(_RETIRED_INDEXES)
+        # 현재 모델이 선언한 인덱스는 그대로 남는다
+        assert {"idx_articles_recent_hash", "idx_articles_published_date"} <= names
+    finally:
+        await factory.close()
+
+
+async def test_create_tables_is_idempotent_on_a_fresh_db(tmp_path: Path) -> None:
+    factory = SessionFactory(f"sqlite+aiosqlite:///{tmp_path / 'fresh.db'}")
+    try:
+        await factory.create_tables()
+        before = await _index_names(factory)
+        await factory.create_tables()
+        assert await _index_names(factory) == before
+        assert before.isdisjoint(_RETIRED_INDEXES)
+    finally:
+        await factory.close()
@@ -0,0 +1,139 @@
+"""fred_fetcher 캐시 구간 재조회/병합 테스트이다."""
+from __future__ import annotations
+
+import json
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from src.common.cache_gateway import CacheClient
+from src.indicators.misc.fred_fetcher import _fetch_series
+
+if TYPE_CHECKING:
+    from conftest import FakeHttpClient
+
+_KEY = "macro:DGS10"
+
+
+def _body(*observations: tuple[str, str]) -> str:
+    """FRED observations 응답 본문을 만든다."""
+    return json.dumps({
+        "observations": [{"date": d, "value": v} for d, v in observations],
+    })
+
+
+async def test_empty_cache_requests_latest_window_without_start(
+    http_client: FakeHttpClient, cache: CacheClient,
+) -> None:
+    http_client.queue(body=_body(("2026-03-02", "4.1"), ("2026-03-01", ".")))
+
+    assert await _fetch_series(http_client, cache, "DGS10", "key", 60)  # type: ignore[arg-type]
+
+    params = http_client.calls[0]["params"]
+    assert "observation_start" not in params
+    assert params["sort_order"] == "desc"
+    assert params["limit"] == "30"
+    # 결측값(".")은 캐시에 넣지 않는다
+    assert await cache.read_json(_KEY) == [{"date": "2026-03-02", "value": 4.1}]
+
+
+async def test_recent_window_is_refetched_and_replaces_cached_values(
+    http_client: FakeHttpClient, cache: CacheClient,
+) -> None:
+    await cache.write_json(_KEY, [
+        {"date": "2026-03-01", "value": 3.0},
+        {"date": "2026-02-01", "value": 2.0},
+        {"date": "2026-01-01", "value": 1.0},
+    ])
+    # 3월 값은 수정되고 2월 값은 결측(".")으로 바뀌었으며 4월 값이 새로 추가된 응답이다
+    http_client.queue(body=_body(
+        ("2026-04-01", "4.0"), ("2026-03-01", "3.5"), ("2026-02-01", "."),
+    ))
+
+    assert await _fetch_series(http_client, cache, "DGS10", "key", 60)  # type: ignore[arg-type]
+
+    # 캐시 전체가 아니라 최신 관측일 30일 전부터만 다시 받는다
+    assert http_client.calls[0]["params"]["observation_start"] == "2026-01-30"
+    assert await cache.read_json(_KEY) == [
+        {"date": "2026-04-01", "value": 4.0},
+        {"date": "2026-03-01", "value": 3.5},
+        {"date": "2026-01-01", "value": 1.0},
+    ]
+
+
+async def test_truncated_response_only_replaces_the_dates_it_covers(
+    http_client: FakeHttpClient, cache: CacheClient,
+) -> None:
+    await cache.write_json(_KEY, [
+        {"date": "2026-03-31", "value": 1.0},
+        {"date": "2026-03-05", "value": 0.5},
+    ])
+    # limit(30)건을 꽉 채운 응답은 가장 오래된 반환일(03-31) 이전 구간을 덮지 않는다
+    days = [(date(2026, 4, 29) - timedelta(days=i)).isoformat() for i in range(30)]
+    http_client.queue(body=_body(*((d, ".") if d == "2026-04-10" else (d, "2.0") for d in days)))
+
+    assert await _fetch_series(http_client, cache, "DGS10", "key", 60)  # type: ignore[arg-type]
+
+    merged = await cache.read_json(_KEY)
+    assert isinstance(merged, list)
+    assert len(merged) == 30
+    assert "2026-04-10" not in {o["date"] for o in merged}
+    assert merged[-2:] == [
+        {"date": "2026-03-31", "value": 2.0},
+        {"date": "2026-03-05", "value": 0.5},
+    ]
+
+
+async def test_http_failure_leaves_cache_untouched(
+    http_client: FakeHttpClient, cache: CacheClient,
+) -> None:
+    cached = [{"date": "2026-03-01", "value": 3.0}]
+    await cache.write_json(_KEY, cached)
+    http_client.queue(status=500)
+
+    assert not await _fetch_series(http_client, cache, "DGS10", "key", 60)  # type: ignore[arg-type]
+    assert await cache.read_json(_KEY) == cached
+
+
+async def test_unchanged_window_does_not_extend_ttl(
+    http_client: FakeHttpClient, cache: CacheClient,
+) -> None:
+    await cache.write_json(_KEY, [
+        {"date": "2026-03-01", "value": 3.0},
+        {"date": "2026-01-01", "value": 1.0},
+    ], ttl=60)
+    raw_before = await cache.read(_KEY)
+    http_client.queue(body=_body(("2026-03-01", "3.0")))
+
+    assert await _fetch_series(http_client, cache, "DGS10", "key", 86400)  # type: ignore[arg-type]
+
+    # 기존 값과 만료 시각을 그대로 두어 예정대로 만료된 뒤 전체 구간을 다시 받게 한다
+    assert await cache.read(_KEY) == raw_before
+    remaining = await cache.ttl(_KEY)
+    assert remaining is not None and remaining <= 60
+
+
+async def test_changed_window_is_written_with_a_fresh_ttl(
+    http_client: FakeHttpClient, cache: CacheClient,
+) -> None:
+    await cache.write_json(_KEY, [{"date": "2026-03-01", "value": 3.0}], ttl=60)
+    http_client.queue(body=_body(("2026-03-01", "3.5")))
+
+    assert await _fetch_series(http_client, cache, "DGS10", "key", 86400)  # type: ignore[arg-type]
+
+    assert await cache.read_json(_KEY) == [{"date": "2026-03-01", "value": 3.5}]
+    remaining = await cache.ttl(_KEY)
+    assert remaining is not None and remaining > 60
+
+
+async def test_empty_response_keeps_cache_and_ttl(
+    http_client: FakeHttpClient, cache: CacheClient,
+) -> None:
+    await cache.write_json(_KEY, [{"date": "2026-03-01", "value": 3.0}], ttl=60)
+    raw_before = await cache.read(_KEY)
+    http_client.queue(body=_body())
+
+    assert await _fetch_series(http_client, cache, "DGS10", "key", 86400)  # type: ignore[arg-type]
+
+    assert await cache.read(_KEY) == raw_before
+    remaining = await cache.ttl(_KEY)
+    assert remaining is not None and remaining <= 60
@@ -0,0 +1,54 @@
+"""HttpResponse.json 파싱과 AsyncHttpClient 재시도 옵션 테스트이다."""
+from __future__ import annotations
+
+import json
+import math
+
+import pytest
+
+from src.common.http_client import AsyncHttpClient, HttpResponse
+
+
+def test_json_parses_regular_body() -> None:
+    resp = HttpResponse(status=200, body='{"value": 1.5, "items": [1, 2]}')
+
+    assert resp.json() == {"value": 1.5, "items": [1, 2]}
+
+
+def test_json_falls_back_for_non_finite_values_and_big_ints() -> None:
+    # orjson은 NaN/Infinity 리터럴과 64비트 초과 정수를 거부하지만 표준 json은 받아들인다
+    resp = HttpResponse(
+        status=200,
+        body='{"nan": NaN, "inf": Infinity, "big": 123456789012345678901234567890}',
+    )
+
+    parsed = resp.json()
+
+    assert math.isnan(parsed["nan"])
+    assert parsed["inf"] == math.inf
+    assert parsed["big"] == 123456789012345678901234567890
+
+
+def test_json_still_raises_on_malformed_body() -> None:
+    resp = HttpResponse(status=200, body="<html>not json</html>")
+
+    with pytest.raises(json.JSONDecodeError):
+        resp.json()
+
+
+async def test_get_with_single_attempt_skips_5xx_retries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = AsyncHttpClient()
+    sent: list[str] = []
+
+    async def _send_once(method: str, url: str, *args: object) -> HttpResponse:
+        sent.append(url)
+        return HttpResponse(status=503, body="")
+
+    monkeypatch.setattr(client, "_send_once", _send_once)
+
+    resp = await client.get("https://api.example/x", max_retries=1)
+
+    assert resp.status == 503
+    assert sent == ["https://api.example/x"]
@@ -0,0 +1,63 @@
+"""indicator_persister 일괄 INSERT 경로 테스트이다."""
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from sqlalchemy import select
+
+from src.common.database_gateway import SessionFactory
+from src.db.models import IndicatorHistory
+from src.orchestration.phases.indicator_persister import persist_indicator_bundle
+
+
+async def _rows(db: SessionFactory) -> list[IndicatorHistory]:
+    """저장된 indicator_history 행을 지표 이름순으로 반환한다."""
+    async with db.get_session() as session:
+        result = await session.execute(
+            select(IndicatorHistory).order_by(IndicatorHistory.indicator_name),
+        )
+        return list(result.scalars())
+
+
+async def test_snapshot_rows_share_recorded_at_and_keep_metadata(
+    db: SessionFactory,
+) -> None:
+    bundle = SimpleNamespace(
+        technical=SimpleNamespace(rsi=55.5, atr=1.25, macd=float("nan")),
+        order_flow=SimpleNamespace(obi=0.3),
+        momentum=SimpleNamespace(alignment=1),
+    )
+
+    saved = await persist_indicator_bundle(db, "SOXL", bundle)  # type: ignore[arg-type]
+
+    assert saved == 4  # NaN인 macd와 누락 지표는 기록하지 않는다
+    rows = await _rows(db)
+    assert [(r.indicator_name, r.value) for r in rows] == [
+        ("atr", 1.25), ("momentum_alignment", 1.0), ("obi", 0.3), ("rsi", 55.5),
+    ]
+    assert {r.ticker for r in rows} == {"SOXL"}
+    assert len({r.recorded_at for r in rows}) == 1
+    by_name = {r.indicator_name: r.metadata_ for r in rows}
+    assert by_name["obi"] == {"source": "order_flow"}
+    assert by_name["momentum_alignment"] == {"source": "cross_asset"}
+    assert by_name["rsi"] == {}
+
+
+async def test_missing_bundle_or_indicators_write_nothing(db: SessionFactory) -> None:
+    assert await persist_indicator_bundle(db, "SOXL", None) == 0
+    empty = SimpleNamespace(technical=SimpleNamespace(), order_flow=None, momentum=None)
+    assert await persist_indicator_bundle(db, "SOXL", empty) == 0  # type: ignore[arg-type]
+    assert await _rows(db) == []
+
+
+async def test_write_failure_returns_zero(tmp_path: Path) -> None:
+    # 스키마 없는 DB에서는 INSERT가 실패하며 예외 대신 0을 반환해야 한다
+    factory = SessionFactory(f"sqlite+aiosqlite:///{tmp_path / 'empty.db'}")
+    bundle = SimpleNamespace(
+        technical=SimpleNamespace(rsi=50.0), order_flow=None, momentum=None,
+    )
+    try:
+        assert await persist_indicator_bundle(factory, "SOXL", bundle) == 0  # type: ignore[arg-type]
+    finally:
+        await factory.close()
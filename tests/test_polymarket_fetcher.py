@@ -0,0 +1,49 @@
+"""PolymarketFetcher 페이지 조회 조기 중단 테스트이다."""
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from src.common.cache_gateway import CacheClient
+from src.indicators.external.polymarket_fetcher import _PAGE_SIZE, PolymarketFetcher
+
+if TYPE_CHECKING:
+    from conftest import FakeHttpClient
+
+
+def _page(count: int, start: int = 0) -> str:
+    """금융 관련 이벤트 count건으로 된 events 응답 본문을 만든다."""
+    return json.dumps([
+        {
+            "title": f"Fed rate cut {i}",
+            "slug": f"fed-{i}",
+            "markets": [{"question": "Cut?", "outcomePrices": '["0.4"]', "volume": i}],
+        }
+        for i in range(start, start + count)
+    ])
+
+
+async def test_short_first_page_skips_remaining_requests(
+    http_client: FakeHttpClient, cache: CacheClient,
+) -> None:
+    http_client.queue(body=_page(3))
+
+    events = await PolymarketFetcher(cache, http_client).fetch()  # type: ignore[arg-type]
+
+    assert len(events) == 3
+    assert [c["params"]["offset"] for c in http_client.calls] == ["0"]
+
+
+async def test_full_first_page_fetches_the_rest(
+    http_client: FakeHttpClient, cache: CacheClient,
+) -> None:
+    http_client.queue(body=_page(_PAGE_SIZE))
+    http_client.queue(body=_page(5, start=_PAGE_SIZE))
+    http_client.queue(body=_page(0))
+    http_client.queue(body=_page(0))
+
+    events = await PolymarketFetcher(cache, http_client).fetch()  # type: ignore[arg-type]
+
+    assert len(http_client.calls) == 4
+    assert http_client.calls[0]["params"]["offset"] == "0"
+    assert events[0]["slug"] == f"fed-{_PAGE_SIZE + 4}"
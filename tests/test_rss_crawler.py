@@ -0,0 +1,77 @@
+"""RssCrawler 조건부 GET(ETag/Last-Modified) 테스트이다."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.crawlers.models import SourceConfig
+from src.crawlers.sources.rss_crawler import RssCrawler
+
+if TYPE_CHECKING:
+    from conftest import FakeHttpClient
+
+_SOURCE = SourceConfig(
+    name="reuters", url="https://feeds.example/reuters.xml", source_type="rss",
+)
+_FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>t</title>
+<item><title>Fed holds rates</title><link>https://news.example/1</link>
+<pubDate>Mon, 02 Mar 2026 14:00:00 GMT</pubDate><description>body</description></item>
+</channel></rss>"""
+_VALIDATORS = {"ETag": '"v1"', "Last-Modified": "Mon, 02 Mar 2026 14:00:00 GMT"}
+
+
+async def test_first_request_is_unconditional_and_stores_validators(
+    http_client: FakeHttpClient,
+) -> None:
+    crawler = RssCrawler(http_client)  # type: ignore[arg-type]
+    http_client.queue(body=_FEED, headers=_VALIDATORS)
+
+    articles = await crawler.crawl(_SOURCE)
+
+    assert [a.title for a in articles] == ["Fed holds rates"]
+    assert http_client.calls[0]["headers"] is None
+
+
+async def test_second_request_is_conditional_and_304_returns_nothing(
+    http_client: FakeHttpClient,
+) -> None:
+    crawler = RssCrawler(http_client)  # type: ignore[arg-type]
+    http_client.queue(body=_FEED, headers=_VALIDATORS)
+    http_client.queue(status=304)
+
+    await crawler.crawl(_SOURCE)
+    articles = await crawler.crawl(_SOURCE)
+
+    assert articles == []
+    assert http_client.calls[1]["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 02 Mar 2026 14:00:00 GMT",
+    }
+
+
+async def test_validator_header_names_are_case_insensitive(
+    http_client: FakeHttpClient,
+) -> None:
+    crawler = RssCrawler(http_client)  # type: ignore[arg-type]
+    http_client.queue(body=_FEED, headers={"etag": '"lower"'})
+    http_client.queue(status=304)
+
+    await crawler.crawl(_SOURCE)
+    await crawler.crawl(_SOURCE)
+
+    assert http_client.calls[1]["headers"] == {"If-None-Match": '"lower"'}
+
+
+async def test_failed_response_does_not_store_validators(
+    http_client: FakeHttpClient,
+) -> None:
+    crawler = RssCrawler(http_client)  # type: ignore[arg-type]
+    http_client.queue(status=503, headers=_VALIDATORS)
+    http_client.queue(body=_FEED)
+
+    assert await crawler.crawl(_SOURCE) == []
+    articles = await crawler.crawl(_SOURCE)
+
+    # 실패 응답의 검증자로 조건부 요청을 보내면 다음 성공 본문이 304로 묻힐 수 있다
+    assert http_client.calls[1]["headers"] is None
+    assert len(articles) == 1